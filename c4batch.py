@@ -0,0 +1,142 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+import c4utils
+import numpy as np
+
+# Cell codes in board arrays; X and O follow the order of c4utils.LETTERS
+PIECES: dict = {" ": 0, "X": 1, "O": 2}
+
+# Every window of c4utils.WINDOWS as flat (row * MAX_COLS + col) indices into a 2D board
+WINDOW_CELLS: np.ndarray = np.array([[(c4utils.MAX_ROWS - 1 - bit % c4utils.COLUMN_HEIGHT) * c4utils.MAX_COLS + bit // c4utils.COLUMN_HEIGHT for bit in window]
+									 for window in c4utils.WINDOWS], dtype=np.intp)
+WINDOW_SCORES: np.ndarray = np.array(c4utils.WINDOW_SCORES, dtype=np.int32)
+
+# Per-cell contribution to the c4utils window code (X tokens * 5 + O tokens), indexed by PIECES value
+CELL_CODES: np.ndarray = np.array([0, c4utils.WINDOW_STEP[0], c4utils.WINDOW_STEP[1]], dtype=np.int8)
+
+# The bitboard index of every 2D board cell, in row-major order
+CELL_BITS: np.ndarray = np.array([c * c4utils.COLUMN_HEIGHT + c4utils.MAX_ROWS - 1 - r for r in range(c4utils.MAX_ROWS) for c in range(c4utils.MAX_COLS)], dtype=np.uint64)
+
+
+def boards_to_array(boards: [[[]]]) -> np.ndarray:
+	"""
+	Convert 2D game boards into an (N, MAX_ROWS, MAX_COLS) int8 array
+
+	boards -- a list of 2D game boards
+	"""
+
+	return np.array([[[PIECES[cell] for cell in row] for row in board] for board in boards], dtype=np.int8).reshape(-1, c4utils.MAX_ROWS, c4utils.MAX_COLS)
+
+
+def positions_to_array(positions: [c4utils.Position]) -> np.ndarray:
+	"""
+	Convert bitboard positions into an (N, MAX_ROWS, MAX_COLS) int8 array
+
+	positions -- a list of c4utils positions
+	"""
+
+	return bitboards_to_array(np.array([position.bitboards for position in positions], dtype=np.uint64).reshape(-1, 2))
+
+
+def bitboards_to_array(bitboards: np.ndarray) -> np.ndarray:
+	"""
+	Convert token masks into an (N, MAX_ROWS, MAX_COLS) int8 array
+
+	bitboards -- an (N, 2) uint64 array of X and O masks
+	"""
+
+	x: np.ndarray = (bitboards[:, 0:1] >> CELL_BITS) & np.uint64(1)
+	o: np.ndarray = (bitboards[:, 1:2] >> CELL_BITS) & np.uint64(1)
+	return (x + 2 * o).astype(np.int8).reshape(-1, c4utils.MAX_ROWS, c4utils.MAX_COLS)
+
+
+def evaluate_batch(boards: np.ndarray) -> (np.ndarray, np.ndarray):
+	"""
+	Evaluate many boards at once with the c4utils window heuristic
+
+	boards -- an (N, MAX_ROWS, MAX_COLS) int8 array coded like PIECES
+
+	Returns a tuple of N int32 scores for X (as c4utils.evaluate_board(board, "X")) and N win flags
+	"""
+
+	# Gather each window's 4 cells, giving an (N, windows, 4) array, and sum them into window codes
+	codes: np.ndarray = CELL_CODES[boards.reshape(len(boards), c4utils.CELLS)[:, WINDOW_CELLS]].sum(axis=2, dtype=np.int8)
+
+	scores: np.ndarray = WINDOW_SCORES[codes].sum(axis=1, dtype=np.int32)
+	wins: np.ndarray = ((codes == 4 * c4utils.WINDOW_STEP[0]) | (codes == 4 * c4utils.WINDOW_STEP[1])).any(axis=1)
+	return scores, wins
+
+
+def search_frontier(position: c4utils.Position, depth: int) -> (int, int):
+	"""
+	Minimax search that scores its whole leaf frontier in a single batch
+
+	position -- the position to search; moves are made and unmade in place
+	depth -- plies to search, including the root move
+
+	Returns a tuple of the best column and its score for the player to move, or -1 for the column if no move is searched
+	"""
+
+	if position.has_won(position.turn ^ 1):
+		return -1, -(c4utils.WIN_SCORE - position.moves)
+	if position.is_full() or depth < 1:
+		return -1, position.evaluate(position.turn)
+
+	leaves: [[int]] = []
+	leaf_turns: [int] = []
+
+	def expand(remaining: int) -> any:
+		"""
+		Walk the tree, collecting leaves
+
+		remaining -- plies left to search
+
+		Returns a leaf index, a final score in a one-item tuple, or a list of (column, subtree) pairs
+		"""
+
+		if position.is_full():
+			return (0,)
+		if remaining == 0:
+			leaves.append(list(position.bitboards))
+			leaf_turns.append(position.turn)
+			return len(leaves) - 1
+
+		children: list = []
+		for col in c4utils.CENTER_ORDER:
+			if position.can_play(col):
+				position.play(col)
+				if position.has_won(position.turn ^ 1):
+					children.append((col, (-(c4utils.WIN_SCORE - position.moves),)))
+				else:
+					children.append((col, expand(remaining - 1)))
+				position.undo()
+		return children
+
+	def backup(node: any) -> int:
+		"""
+		Negamax the leaf scores back up the collected tree
+
+		node -- a subtree returned by expand
+
+		Returns the score for the player to move at the node
+		"""
+
+		if isinstance(node, int):
+			return leaf_scores[node]
+		if isinstance(node, tuple):
+			return node[0]
+		return max(-backup(child) for col, child in node)
+
+	root: list = expand(depth)
+	leaf_scores: [int] = []
+	if leaves:
+		scores: np.ndarray = evaluate_batch(bitboards_to_array(np.array(leaves, dtype=np.uint64)))[0]
+		leaf_scores = np.where(np.array(leaf_turns) == 0, scores, -scores).tolist()
+
+	best_col, best_score = -1, -c4utils.WIN_SCORE - 1
+	for col, child in root:
+		score: int = -backup(child)
+		if score > best_score:
+			best_col, best_score = col, score
+	return best_col, best_score
@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+import c4utils
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+# Bump whenever POSITIONS changes, so results from different sets are never compared
+POSITIONS_VERSION: int = 1
+
+# Benchmark positions as the columns played from an empty board; none is over and none has a win in one
+POSITIONS: dict = {
+	"opening": "3342",
+	"midgame": "334245231560264",
+	"tactical": "213500640240410044",
+	"near_full": "23601164023243340356155221316254"
+}
+
+# Calls per check_win and evaluate_board timing
+CALLS: int = 2000
+
+# Timed runs per search; the fastest is reported, since slower runs only add noise from the rest of the machine
+REPEATS: int = 3
+
+
+def board_from_moves(moves: str) -> ([[]], chr):
+	"""
+	Play a benchmark position onto a new board
+
+	moves -- the columns played from an empty board
+
+	Returns a tuple of the 2D game board and the letter to move
+	"""
+
+	position: c4utils.Position = c4utils.Position()
+	for col in moves:
+		position.play(int(col))
+	return position.to_board(), c4utils.LETTERS[position.turn]
+
+
+def peak_memory(function: callable) -> int:
+	"""
+	Run a function once while tracing allocations
+
+	function -- the function to run without arguments
+
+	Returns the most bytes allocated at once during the call
+	"""
+
+	tracemalloc.start()
+	try:
+		function()
+		return tracemalloc.get_traced_memory()[1]
+	finally:
+		tracemalloc.stop()
+
+
+def time_calls(function: callable, calls: int) -> float:
+	"""
+	Time repeated calls of a function
+
+	function -- the function to run without arguments
+	calls -- the number of calls
+
+	Returns the wall time in seconds
+	"""
+
+	start: float = time.perf_counter()
+	for call in range(calls):
+		function()
+	return time.perf_counter() - start
+
+
+def run(max_depth: int = 8) -> dict:
+	"""
+	Benchmark the board helpers and the hard algorithm on every benchmark position
+
+	max_depth -- the deepest cpu_algorithm_hard search, run after every shallower one
+
+	Returns the results as a dict ready for JSON
+	"""
+
+	results: [dict] = []
+	for name, moves in POSITIONS.items():
+		board, letter = board_from_moves(moves)
+		for benchmark, function in (("check_win", lambda: c4utils.check_win(board)),
+									("evaluate_board", lambda: c4utils.evaluate_board(board, letter))):
+			seconds: float = time_calls(function, CALLS)
+			results.append({"benchmark": benchmark, "position": name, "calls": CALLS, "seconds": seconds,
+							"us_per_call": seconds / CALLS * 1e6, "peak_bytes": peak_memory(function)})
+
+		for depth in range(1, min(max_depth, c4utils.CELLS - len(moves)) + 1):
+			stats: [c4utils.SearchStats] = []
+			seconds: float = min(time_calls(lambda: c4utils.cpu_algorithm_hard([row[:] for row in board], letter, depth, observer=stats.append), 1)
+								 for repeat in range(REPEATS))
+			results.append({"benchmark": "cpu_algorithm_hard", "position": name, "depth": depth, "column": stats[-1].pv[0],
+							"seconds": seconds, "nodes": stats[-1].nodes, "nps": stats[-1].nodes / seconds,
+							"cutoffs": stats[-1].cutoffs, "first_move_cutoffs": stats[-1].first_move_cutoffs,
+							"table_hits": stats[-1].table_hits, "table_misses": stats[-1].table_misses,
+							"peak_bytes": peak_memory(lambda: c4utils.cpu_algorithm_hard([row[:] for row in board], letter, depth))})
+
+	return {"positions_version": POSITIONS_VERSION, "python": platform.python_version(), "machine": platform.machine(),
+			"max_depth": max_depth, "results": results}
+
+
+def report(run_results: dict) -> str:
+	"""
+	Format benchmark results as a table
+
+	run_results -- the dict returned by run
+	"""
+
+	lines: [str] = ["%-18s %-10s %5s %12s %12s %12s %10s" % ("benchmark", "position", "depth", "seconds", "nodes", "nodes/s", "peak KiB")]
+	for result in run_results["results"]:
+		lines.append("%-18s %-10s %5s %12.6f %12s %12s %10.1f" % (
+			result["benchmark"], result["position"], result.get("depth", "-"), result["seconds"], result.get("nodes", "-"),
+			"%.0f" % result["nps"] if "nps" in result else "-", result["peak_bytes"] / 1024))
+	return "\n".join(lines)
+
+
+if __name__ == "__main__":
+	if len(sys.argv) > 3:
+		print("usage: %s [MAX_DEPTH [JSON_FILE]]" % sys.argv[0])
+		sys.exit(1)
+	results: dict = run(int(sys.argv[1]) if len(sys.argv) > 1 else 8)
+	print(report(results))
+	if len(sys.argv) == 3:
+		with open(sys.argv[2], "w") as fp:
+			json.dump(results, fp, indent=1)
@@ -0,0 +1,136 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+import bisect
+import c4utils
+import mmap
+import os
+import struct
+import sys
+
+# One book entry: the canonical position key, the best column for that key, and the solver score (or UNSOLVED), little endian
+RECORD: struct.Struct = struct.Struct("<Qbb")
+
+# Score stored for positions the solver could not finish; their move comes from the hard search
+UNSOLVED: int = -128
+
+
+class OpeningBook:
+	"""Read-only opening book over a memory-mapped file of records sorted by key"""
+
+	def __init__(self, path: str):
+		"""
+		Map a book file; pages are loaded on demand and shared with every other process mapping it
+
+		path -- the book file written by build_book
+		"""
+
+		self.path: str = path
+		self.size: int = os.path.getsize(path) // RECORD.size
+		self.data: mmap.mmap = None
+		if self.size:
+			with open(path, "rb") as fp:
+				self.data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+	def __len__(self) -> int:
+		"""Get the number of records"""
+
+		return self.size
+
+	def __getitem__(self, index: int) -> int:
+		"""Get the key of a record, so bisect can search the file directly"""
+
+		return RECORD.unpack_from(self.data, index * RECORD.size)[0]
+
+	def lookup(self, position: c4utils.Position) -> (int, int):
+		"""
+		Binary search the book for a position
+
+		position -- the position to look up
+
+		Returns a tuple of the best column and its score (UNSOLVED if unknown), or None if the position is not in the book
+		"""
+
+		key, mirrored = position.canonical_key()
+		index: int = bisect.bisect_left(self, key)
+		if index == self.size:
+			return None
+		record_key, col, score = RECORD.unpack_from(self.data, index * RECORD.size)
+		if record_key != key:
+			return None
+		return c4utils.MAX_COLS - 1 - col if mirrored else col, score
+
+	def close(self) -> None:
+		"""Unmap the book file"""
+
+		if self.data is not None:
+			self.data.close()
+			self.data = None
+
+
+def open_book(path: str) -> OpeningBook:
+	"""
+	Open a book file if it exists
+
+	path -- the book file written by build_book
+
+	Returns the book, or None if there is no file
+	"""
+
+	if not os.path.isfile(path):
+		return None
+	return OpeningBook(path)
+
+
+def build_book(path: str, plies: int, time_ms: int = None) -> int:
+	"""
+	Solve every position up to a number of tokens and write them as a sorted book file
+
+	path -- the book file to write
+	plies -- the most tokens a booked position may have
+	time_ms -- an optional solving budget per position in milliseconds; positions that run out get the hard search move instead
+
+	Returns the number of records written
+	"""
+
+	solver: c4utils.Solver = c4utils.shared_solver()
+	records: dict = {}
+
+	def visit(position: c4utils.Position) -> None:
+		"""
+		Book a position and every position after it, up to the token limit
+
+		position -- the position to book; moves are made and unmade in place
+		"""
+
+		# A position and its mirror image share one record, stored for whichever has the smaller key
+		key, mirrored = position.canonical_key()
+		if key in records or position.is_full():
+			return
+		try:
+			solution: c4utils.Solution = solver.solve(position, time_ms)
+			col, score = solution.move, solution.score
+		except c4utils.SearchTimeout:
+			col, score = c4utils.Search(position).iterative_deepening(time_ms)[0], UNSOLVED
+		records[key] = (c4utils.MAX_COLS - 1 - col if mirrored else col, score)
+
+		if position.moves < plies:
+			for col in c4utils.CENTER_ORDER:
+				if position.can_play(col):
+					position.play(col)
+					if not position.has_won(position.turn ^ 1):
+						visit(position)
+					position.undo()
+
+	visit(c4utils.Position())
+	with open(path, "wb") as fp:
+		for key in sorted(records):
+			fp.write(RECORD.pack(key, *records[key]))
+	return len(records)
+
+
+if __name__ == "__main__":
+	if len(sys.argv) not in (3, 4):
+		print("usage: %s BOOK_FILE PLIES [TIME_MS]" % sys.argv[0])
+		sys.exit(1)
+	print("%d positions written" % build_book(sys.argv[1], int(sys.argv[2]), int(sys.argv[3]) if len(sys.argv) == 4 else None))
@@ -0,0 +1,263 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+import c4utils
+import mmap
+import os
+import struct
+import sys
+
+# One cache slot or log record: the canonical Zobrist hash and a packed transposition entry, little endian
+SLOT: struct.Struct = struct.Struct("<Qq")
+
+# Log records appended since the last compaction before a flush compacts on its own
+COMPACT_RECORDS: int = 4096
+
+
+def read_log(path: str, offset: int = 0) -> ([(int, int)], int):
+	"""
+	Read the whole records of a log file from an offset
+
+	path -- the log file
+	offset -- the byte offset to start from
+
+	Returns a tuple of the (key, entry) records and the offset after the last whole record
+	"""
+
+	try:
+		with open(path, "rb") as fp:
+			fp.seek(offset)
+			data: bytes = fp.read()
+	except FileNotFoundError:
+		return [], offset
+	data = data[:len(data) - len(data) % SLOT.size]
+	return list(SLOT.iter_unpack(data)), offset + len(data)
+
+
+def deeper(entry: int, other: int) -> bool:
+	"""
+	Determine if a packed entry should replace another for the same key
+
+	entry -- the new packed entry
+	other -- the stored packed entry, or 0
+	"""
+
+	return not other or (entry >> 8) & 0xFF >= (other >> 8) & 0xFF
+
+
+class PersistentCache:
+	"""
+	Search results kept on disk between games and shared by every process opening the same file
+
+	Results go to an append-only log in batches. Compaction merges the log into an open-addressing hash file that each
+	process maps read-only, so its pages are shared and loaded on demand. Nothing is read until the first lookup, and
+	records other processes append are picked up on later lookups. A record appended while another process compacts
+	may be lost, which only costs a search.
+	"""
+
+	def __init__(self, path: str, batch: int = 16):
+		"""
+		Set up the cache; the files are created by the first flush
+
+		path -- the hash file; the log is the same path with ".log" appended
+		batch -- the number of results to hold in memory before appending them to the log
+		"""
+
+		self.path: str = path
+		self.log_path: str = path + ".log"
+		self.batch: int = batch
+		self.data: mmap.mmap = None
+		self.slots: int = 0
+		self.stamp: tuple = None
+		self.log_offset: int = 0
+		self.recent: dict = {}
+		self.pending: [(int, int)] = []
+		self.loaded: bool = False
+
+	def load(self) -> None:
+		"""Map the hash file and read the log, or just read new log records if neither file was replaced"""
+
+		try:
+			stat: os.stat_result = os.stat(self.path)
+			stamp: tuple = (stat.st_ino, stat.st_mtime_ns)
+		except FileNotFoundError:
+			stamp: tuple = None
+		try:
+			log_size: int = os.path.getsize(self.log_path)
+		except FileNotFoundError:
+			log_size: int = 0
+
+		# A new hash file or a shorter log means another process compacted, so start over from its files
+		if stamp != self.stamp or log_size < self.log_offset:
+			self.unmap()
+			self.stamp = stamp
+			self.log_offset = 0
+			self.recent = {key: entry for key, entry in self.pending}
+			if stamp is not None and os.path.getsize(self.path):
+				with open(self.path, "rb") as fp:
+					self.data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+				self.slots = len(self.data) // SLOT.size
+		if log_size > self.log_offset or not self.loaded:
+			records, self.log_offset = read_log(self.log_path, self.log_offset)
+			for key, entry in records:
+				if deeper(entry, self.recent.get(key, 0)):
+					self.recent[key] = entry
+		self.loaded = True
+
+	def probe(self, key: int) -> int:
+		"""
+		Find a key in the hash file
+
+		key -- the canonical Zobrist hash
+
+		Returns the packed entry, or 0 if absent
+		"""
+
+		if not self.slots:
+			return 0
+		index: int = key & (self.slots - 1)
+		while True:
+			slot_key, entry = SLOT.unpack_from(self.data, index * SLOT.size)
+			if slot_key == key or not entry:
+				return entry
+			index = (index + 1) & (self.slots - 1)
+
+	def known(self, key: int) -> int:
+		"""
+		Find the deepest result for a key in the log or the hash file
+
+		key -- the canonical Zobrist hash
+
+		Returns the packed entry, or 0 if absent
+		"""
+
+		entry: int = self.recent.get(key, 0)
+		stored: int = self.probe(key)
+		return stored if stored and deeper(stored, entry) else entry
+
+	def get(self, position: c4utils.Position) -> tuple:
+		"""
+		Look up a position as a (depth, bound, value, move) tuple, or None if absent
+
+		position -- the position to look up; its mirror image shares the result
+		"""
+
+		self.load()
+		key, mirrored = position.mirror_hash, True
+		if position.hash <= key:
+			key, mirrored = position.hash, False
+		entry: int = self.known(key)
+		if not entry:
+			return None
+		move: int = (entry & 0xF) - 1
+		if mirrored and move >= 0:
+			move = c4utils.MAX_COLS - 1 - move
+		return (entry >> 8) & 0xFF, (entry >> 4) & 0xF, entry >> 16, move
+
+	def put(self, position: c4utils.Position, depth: int, bound: int, value: int, move: int) -> None:
+		"""
+		Store a result unless a deeper one is already known; the log is appended once a batch has built up
+
+		position -- the searched position
+		depth -- the depth the position was searched to
+		bound -- a Bound type for the value
+		value -- the score for the player to move
+		move -- the best column found, or -1
+		"""
+
+		if not self.loaded:
+			self.load()
+		key, mirrored = position.mirror_hash, True
+		if position.hash <= key:
+			key, mirrored = position.hash, False
+		if mirrored and move >= 0:
+			move = c4utils.MAX_COLS - 1 - move
+		entry: int = (value << 16) | (depth << 8) | (bound << 4) | (move + 1)
+		known: int = self.known(key)
+		if entry == known or not deeper(entry, known):
+			return
+		self.recent[key] = entry
+		self.pending.append((key, entry))
+		if len(self.pending) >= self.batch:
+			self.flush()
+
+	def flush(self) -> None:
+		"""Append the pending results to the log in one write, compacting once the log has grown long"""
+
+		if not self.pending:
+			return
+		with open(self.log_path, "ab") as fp:
+			fp.write(b"".join(SLOT.pack(key, entry) for key, entry in self.pending))
+		self.pending = []
+		if os.path.getsize(self.log_path) >= COMPACT_RECORDS * SLOT.size:
+			self.compact()
+
+	def compact(self) -> int:
+		"""
+		Merge the log into a new hash file and empty the log
+
+		The new file replaces the old one in a single rename, so readers keep their old mapping until they reload
+
+		Returns the number of results in the new hash file
+		"""
+
+		self.flush()
+
+		# Move the log aside first, so records appended from now on go to a fresh log
+		merging: str = self.log_path + ".%d" % os.getpid()
+		try:
+			os.replace(self.log_path, merging)
+		except FileNotFoundError:
+			pass
+		records: dict = {}
+		self.unmap()
+		self.stamp = None
+		if os.path.isfile(self.path) and os.path.getsize(self.path):
+			with open(self.path, "rb") as fp:
+				for key, entry in SLOT.iter_unpack(fp.read()):
+					if entry:
+						records[key] = entry
+		for key, entry in read_log(merging)[0]:
+			if deeper(entry, records.get(key, 0)):
+				records[key] = entry
+
+		# Keep the table at most half full, so probes stay short
+		slots: int = 1
+		while slots < 2 * len(records):
+			slots *= 2
+		table: bytearray = bytearray(slots * SLOT.size if records else 0)
+		for key, entry in records.items():
+			index: int = key & (slots - 1)
+			while SLOT.unpack_from(table, index * SLOT.size)[1]:
+				index = (index + 1) & (slots - 1)
+			SLOT.pack_into(table, index * SLOT.size, key, entry)
+		temporary: str = self.path + ".%d" % os.getpid()
+		with open(temporary, "wb") as fp:
+			fp.write(table)
+		os.replace(temporary, self.path)
+		if os.path.isfile(merging):
+			os.remove(merging)
+		self.loaded = False
+		self.load()
+		return len(records)
+
+	def unmap(self) -> None:
+		"""Unmap the hash file"""
+
+		if self.data is not None:
+			self.data.close()
+			self.data = None
+		self.slots = 0
+
+	def close(self) -> None:
+		"""Write the pending results and unmap the hash file"""
+
+		self.flush()
+		self.unmap()
+
+
+if __name__ == "__main__":
+	if len(sys.argv) != 2:
+		print("usage: %s CACHE_FILE" % sys.argv[0])
+		sys.exit(1)
+	print("%d positions kept" % PersistentCache(sys.argv[1]).compact())
@@ -0,0 +1,7 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# Board size, shared by the engine modules and the GUI
+# Only the standard library may be imported here, so engine-only processes never load pygame
+MAX_ROWS: int = 6
+MAX_COLS: int = 7
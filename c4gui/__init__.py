@@ -1,5 +1,7 @@
 #!/usr/bin/python3
 # -*- coding: utf8 -*-
+import c4engine
+import math
 import os
 import pkgutil
 import sys
@@ -12,9 +14,12 @@ SCALE_MODIFIER: float = 1
 ORIGIN_PATH: str = os.path.normpath(os.path.join(os.path.dirname(__file__), "../"))
 ASSET_PATH: str = os.path.join(ORIGIN_PATH, "assets")
 TICKSPEED: int = 30
-CPU_DELAY: int = 5
-MAX_ROWS: int = 6
-MAX_COLS: int = 7
+ANIMATION_TICKSPEED: int = 60
+CPU_DELAY: int = 400
+END_DELAY: int = 2500
+DROP_TIME: int = 350
+MAX_ROWS: int = c4engine.MAX_ROWS
+MAX_COLS: int = c4engine.MAX_COLS
 
 # Initialize pygame
 import pygame  # noqa: E402
@@ -34,6 +39,7 @@ Coordinates = namedtuple("Coordinates", "x y")
 # Inject all submodules
 import c4gui.config  # noqa: E402
 import c4gui.styles  # noqa: E402
+import c4gui.scheduler  # noqa: E402
 import c4gui.game  # noqa: E402
 import c4gui.menu  # noqa: E402
 import c4gui.sfx  # noqa: E402
@@ -76,3 +82,35 @@ def check_sigint(event: pygame.event) -> None:
 		# Gracefully exit
 		pygame.quit()
 		sys.exit()
+
+
+def coalesce_events(events: list) -> list:
+	"""
+	Merge all mouse motion in a batch of events into one event, so a tick handles the same work however many arrive
+
+	The merged motion takes the place of the last one, with its position and the total movement;
+	clicks and every other event keep their order
+
+	events -- The events drained from the pygame queue
+	"""
+
+	motions: list = [i for i, event in enumerate(events) if event.type == pygame.MOUSEMOTION]
+	if len(motions) < 2:
+		return events
+	last: pygame.event.Event = events[motions[-1]]
+	rel: tuple = (sum(events[i].rel[0] for i in motions), sum(events[i].rel[1] for i in motions))
+	merged: pygame.event.Event = pygame.event.Event(pygame.MOUSEMOTION, dict(last.dict, rel=rel))
+	return [merged if i == motions[-1] else event for i, event in enumerate(events) if event.type != pygame.MOUSEMOTION or i == motions[-1]]
+
+
+def wait_events(timeout: float = None) -> list:
+	"""
+	Sleep until an event arrives or a timeout passes, then drain the pygame queue
+
+	timeout -- The most milliseconds to sleep; None sleeps until an event arrives, and 0 does not sleep
+	"""
+
+	if timeout is not None and timeout <= 0:
+		return pygame.event.get()
+	event: pygame.event.Event = pygame.event.wait() if timeout is None else pygame.event.wait(math.ceil(timeout))
+	return ([] if event.type == pygame.NOEVENT else [event]) + pygame.event.get()
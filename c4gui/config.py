@@ -97,47 +97,67 @@ def commit() -> None:
 
 def init() -> None:
 	"""
-	Initialize default settings if no settings file exists
+	Initialize default settings for any that are missing from the settings file
 	"""
 
-	if not os.path.exists(config_path):
-
-		# Define defaults here
-		defaults = {
-			"Global": {
-				"theme": "THEME_LIGHT",
-				"sfx_enabled": True
-			},
-			"Player1": {
-				"name": "Player1",
-				"color": c4gui.styles.COLORS["RED"]
-			},
-			"Player2": {
-				"name": "Player2",
-				"color": c4gui.styles.COLORS["YELLOW"]
-			},
-			"Computer0": {
-				"name": "CPU",
-				"color": c4gui.styles.COLORS["YELLOW"],
-				"difficulty": 5
-			},
-			"Computer1": {
-				"name": "CPU 1",
-				"color": c4gui.styles.COLORS["RED"],
-				"difficulty": 5
-			},
-			"Computer2": {
-				"name": "CPU 2",
-				"color": c4gui.styles.COLORS["YELLOW"],
-				"difficulty": 5
-			},
-			"Network": {
-				"host_port": 6334,
-				"last_connection": "x.x.x.x:6334"
-			}
+	# Define defaults here
+	defaults = {
+		"Global": {
+			"theme": "THEME_LIGHT",
+			"sfx_enabled": True
+		},
+		"Player1": {
+			"name": "Player1",
+			"color": c4gui.styles.COLORS["RED"]
+		},
+		"Player2": {
+			"name": "Player2",
+			"color": c4gui.styles.COLORS["YELLOW"]
+		},
+		# Each CPU player searches with "alphabeta" or "mcts"
+		"Computer0": {
+			"name": "CPU",
+			"color": c4gui.styles.COLORS["YELLOW"],
+			"difficulty": 5,
+			"engine": "alphabeta"
+		},
+		"Computer1": {
+			"name": "CPU 1",
+			"color": c4gui.styles.COLORS["RED"],
+			"difficulty": 5,
+			"engine": "alphabeta"
+		},
+		"Computer2": {
+			"name": "CPU 2",
+			"color": c4gui.styles.COLORS["YELLOW"],
+			"difficulty": 5,
+			"engine": "alphabeta"
+		},
+		"Network": {
+			"host_port": 6334,
+			"last_connection": "x.x.x.x:6334"
+		},
+		"Engine": {
+			# Milliseconds per CPU move, indexed by difficulty - 1 (difficulties below 3 play randomly)
+			"time_budgets": (0, 0, 5, 15, 30, 60, 125, 250, 500, 1000),
+			# Difficulties 9 and up play perfectly once this many tokens are down
+			"solver_discs": 18,
+			# Opening book written by c4book.py, relative to the game folder
+			"book_file": "book.bin",
+			# Search results kept between games by c4cache.py, relative to the game folder; empty keeps none
+			"cache_file": "",
+			# Processes each CPU search splits its root moves across; 1 searches serially and deterministically
+			"search_workers": 1,
+			# Single player CPUs keep searching the human's possible replies while waiting for their move
+			"ponder": True
 		}
-
-		for section in defaults:
-			for setting in defaults[section]:
-				set(section, setting, defaults[section][setting])
+	}
+
+	changed = False
+	for section in defaults:
+		for setting in defaults[section]:
+			if not setting_exists(setting, section):
+				set(section, setting, defaults[section][setting], False)
+				changed = True
+	if changed:
 		commit()
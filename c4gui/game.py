@@ -119,6 +119,24 @@ class Game:
 		self.grid_start_y: int = self.board_start_y + c4gui.styles.GRID_START_Y*self.scale
 		self.inner_padding: int = int((self.tile_size - self.radius) / 2)
 
+		# Scaled images by (asset, color, tilt, size), for the theme and scale they were made with
+		self.sprites: Dict[tuple, pygame.Surface] = {}
+		self.sprites_theme: c4gui.Theme = self.theme
+		self.sprites_scale: float = self.scale
+
+		# What the last frame drew, so the next one only redraws what changed; no cells means a full redraw
+		self.frame_cells: [[str]] = None
+		self.frame_text: tuple = None
+		self.frame_text_surface: pygame.Surface = None
+		self.frame_text_rect: pygame.Rect = None
+		self.frame_hover: Tuple[pygame.Rect, Tuple[int, int, int]] = None
+		self.frame_drop: Tuple[pygame.Rect, Tuple[int, int, int]] = None
+
+		# Falling token rectangles per frame by column and row, for the scale they were made with, and the running drop
+		self.drop_paths: [[Tuple[pygame.Rect, ...]]] = None
+		self.drop_paths_scale: float = None
+		self.drop: tuple = None
+
 	@staticmethod
 	def end_turn(p1turn: bool) -> bool:
 		"""
@@ -164,61 +182,253 @@ class Game:
 
 		return copy.deepcopy(self.boards)
 
+	def get_sprite(self, asset: str, size: Tuple[int, int], color: Tuple[int, int, int] = None, tilted: bool = False) -> pygame.Surface:
+		"""
+		Get a scaled image, loading and scaling it only the first time it is asked for
+
+		asset -- "token" for a player token, or a theme attribute such as "board", "empty" or "icons.nav_first"
+		size -- The width and height to scale to
+		color -- The RGB value of a token
+		tilted -- True for a token's tilted image
+
+		Every image is dropped once the theme or window scale changes
+		"""
+
+		if self.theme is not self.sprites_theme or self.scale != self.sprites_scale:
+			self.sprites = {}
+			self.sprites_theme = self.theme
+			self.sprites_scale = self.scale
+
+		key: tuple = (asset, color, tilted, size)
+		sprite: pygame.Surface = self.sprites.get(key)
+		if sprite is None:
+			if asset == "token":
+				image: pygame.Surface = c4gui.styles.get_color_from_tuple(color, True, tilted)
+			else:
+				image = self.theme
+				for name in asset.split("."):
+					image = getattr(image, name)
+			sprite = pygame.transform.scale(image, size)
+
+			# Match the display's pixel format once, so every later blit is a plain copy
+			if pygame.display.get_surface() is not None:
+				sprite = sprite.convert_alpha()
+			self.sprites[key] = sprite
+		return sprite
+
+	def get_cell_rect(self, r: int, c: int) -> pygame.Rect:
+		"""
+		Get the rectangle a cell's token or empty image is drawn in
+
+		r -- The row of the cell
+		c -- The column of the cell
+		"""
+
+		x = self.grid_start_x + c * self.tile_size + c4gui.styles.X_STRETCH * c
+		y = self.grid_start_y + r * self.tile_size + c4gui.styles.Y_STRETCH * r
+		return pygame.Rect(int(x + c4gui.styles.SPRITE_SCALE * self.scale), int(y + c4gui.styles.SPRITE_SCALE * self.scale), (self.radius - 1) * 2, (self.radius - 1) * 2)
+
+	def get_static_layer(self, empty: bool = True) -> pygame.Surface:
+		"""
+		Get the background, shadow and board composited into one screen-sized image, made once per theme and scale
+
+		empty -- True to include the empty cell image in every cell; tokens are drawn over the layer without them
+		"""
+
+		size: Tuple[int, int] = ((self.radius - 1) * 2, (self.radius - 1) * 2)
+		board: pygame.Surface = self.get_sprite("board", (self.board_width, self.board_height))
+		cell: pygame.Surface = self.get_sprite("empty", size)
+		key: tuple = ("static", None, empty, (self.display_width, self.display_height))
+		layer: pygame.Surface = self.sprites.get(key)
+		if layer is None:
+			layer = pygame.Surface((self.display_width, self.display_height))
+			layer.fill(self.theme.background)
+			pygame.draw.ellipse(layer, self.theme.shadow, (0, int(self.display_height * 0.8), self.display_width, int(self.display_height * 0.4)))
+			layer.blit(board, (self.board_start_x, self.board_start_y))
+			if empty:
+				for c in range(c4gui.MAX_COLS):
+					for r in range(c4gui.MAX_ROWS):
+						layer.blit(cell, self.get_cell_rect(r, c))
+			if pygame.display.get_surface() is not None:
+				layer = layer.convert()
+			self.sprites[key] = layer
+		return layer
+
+	def get_drop_path(self, r: int, c: int) -> Tuple[pygame.Rect, ...]:
+		"""
+		Get the rectangles a token falling into a cell is drawn in, one per frame at ANIMATION_TICKSPEED
+
+		r -- The row of the cell
+		c -- The column of the cell
+
+		Every path falls from the top of the screen with constant acceleration, taking DROP_TIME to reach the bottom
+		row; all of them are made at once and again only when the window scale changes
+		"""
+
+		if self.drop_paths is None or self.scale != self.drop_paths_scale:
+			bottom: int = self.get_cell_rect(c4gui.MAX_ROWS - 1, 0).y
+			self.drop_paths = []
+			self.drop_paths_scale = self.scale
+			for col in range(c4gui.MAX_COLS):
+				self.drop_paths.append([])
+				for row in range(c4gui.MAX_ROWS):
+					cell: pygame.Rect = self.get_cell_rect(row, col)
+					frames: int = max(1, math.ceil(c4gui.DROP_TIME * math.sqrt(cell.y / bottom) * c4gui.ANIMATION_TICKSPEED / 1000))
+					self.drop_paths[col].append(tuple(cell.move(0, int(cell.y * c4gui.scheduler.ease_in(frame / frames)) - cell.y)
+													  for frame in range(frames + 1)))
+		return self.drop_paths[c][r]
+
+	def start_drop(self, scheduler: c4gui.scheduler.Scheduler) -> c4gui.scheduler.Tween:
+		"""
+		Animate the token of the last move falling into its cell; the cell shows empty until it lands
+
+		scheduler -- The scheduler whose frames move the token
+
+		Returns the tween, done once the token lands
+		"""
+
+		for c in range(c4gui.MAX_COLS):
+			for r in range(c4gui.MAX_ROWS):
+				if self.boards[-1][r][c] != self.boards[-2][r][c]:
+					path: Tuple[pygame.Rect, ...] = self.get_drop_path(r, c)
+					tween: c4gui.scheduler.Tween = scheduler.tween((len(path) - 1) * 1000 / c4gui.ANIMATION_TICKSPEED, 0, len(path) - 1)
+					self.drop = (path, tween, r, c, self.players.p1_color if self.boards[-1][r][c] == "X" else self.players.p2_color)
+					return tween
+		return None
+
+	def dropping(self) -> bool:
+		"""Check if a token is still falling"""
+
+		return self.drop is not None and not self.drop[1].done
+
 	def get_icon_dimension(self) -> int:
 		"""Calculate square icon dimensions based on the window scale"""
 
 		return int(140 * self.scale)
 
-	def draw_turn(self, surface: pygame.Surface, p1turn: bool) -> None:
+	def get_hover_color(self, p1turn: bool) -> Tuple[int, int, int]:
 		"""
-		Draw the text description of whose turn it is
+		Get the token color a local player hovers with, or None if no local player is waiting on this turn
 
-		surface -- The pygame surface to draw on
 		p1turn -- True if it's player 1's turn; False if it's player 2's turn
 		"""
-		name = self.players.p1_name if p1turn else self.players.p2_name
-		color = self.players.p1_color if p1turn else self.players.p2_color
-		surface.blit(c4gui.styles.FONT.render("%s'%s turn" % (name, "" if name[-1] == "s" else "s"), True, color), (10, 10))
 
-	def draw_board(self, surface: pygame.Surface, board: int = -1) -> None:
+		if self.game_type == GameType.SINGLE or self.game_type == GameType.HOST and p1turn or self.game_type == GameType.DOUBLE and p1turn:
+			return self.players.p1_color
+		if self.game_type == GameType.JOIN and not p1turn or self.game_type == GameType.DOUBLE:
+			return self.players.p2_color
+		return None
+
+	def draw_frame(self, surface: pygame.Surface, p1turn: bool, hover_x: int = None) -> [pygame.Rect]:
 		"""
-		Draw the board onto a surface
+		Bring the screen up to date with the latest board, the turn text, the falling token and the hovering token,
+		redrawing only what changed
 
 		surface -- The pygame surface to draw on
-		board -- The board index to display (defaults to the most recent)
+		p1turn -- True if it's player 1's turn; False if it's player 2's turn
+		hover_x -- The horizontal position of the mouse, or None if it has not moved over the window
+
+		Returns the rectangles that changed, for pygame.display.update
+		"""
+
+		board: [[str]] = self.boards[-1]
+		name: str = self.players.p1_name if p1turn else self.players.p2_name
+		text: tuple = ("%s'%s turn" % (name, "" if name[-1] == "s" else "s"), self.players.p1_color if p1turn else self.players.p2_color)
+		color: Tuple[int, int, int] = self.get_hover_color(p1turn) if hover_x is not None else None
+		size: int = (self.radius - 1) * 2
+		hover: Tuple[pygame.Rect, Tuple[int, int, int]] = None if color is None else (pygame.Rect(int(hover_x - self.tile_size / 2), 0, size, size), color)
+
+		# A falling token has not reached its cell yet
+		cells: [[str]] = [row[:] for row in board]
+		drop: Tuple[pygame.Rect, Tuple[int, int, int]] = None
+		if self.dropping():
+			path, tween, r, c, drop_color = self.drop
+			cells[r][c] = " "
+			drop = (path[min(len(path) - 1, int(tween.value))], drop_color)
+
+		# Anything drawn with other images or over another frame needs the whole screen redrawn
+		dirty: [pygame.Rect] = []
+		full: bool = self.frame_cells is None or self.theme is not self.sprites_theme or self.scale != self.sprites_scale
+		if full:
+			dirty.append(surface.get_rect())
+		else:
+			for c in range(c4gui.MAX_COLS):
+				for r in range(c4gui.MAX_ROWS):
+					if self.frame_cells[r][c] != cells[r][c]:
+						dirty.append(self.get_cell_rect(r, c))
+			if text != self.frame_text:
+				dirty.append(self.frame_text_rect)
+			if hover != self.frame_hover:
+				dirty.extend(frame[0] for frame in (self.frame_hover, hover) if frame is not None)
+			if drop != self.frame_drop:
+				dirty.extend(frame[0] for frame in (self.frame_drop, drop) if frame is not None)
+
+		self.frame_cells = cells
+		if text != self.frame_text:
+			self.frame_text = text
+			self.frame_text_surface = c4gui.styles.FONT.render(text[0], True, text[1])
+			self.frame_text_rect = self.frame_text_surface.get_rect(topleft=(10, 10))
+			if not full:
+				dirty.append(self.frame_text_rect)
+		self.frame_hover = hover
+		self.frame_drop = drop
+		for rect in dirty:
+			self.redraw_region(surface, rect)
+		return dirty
+
+	def redraw_region(self, surface: pygame.Surface, region: pygame.Rect) -> None:
 		"""
+		Redraw every layer of the last frame inside a rectangle
 
-		# Render the background
-		surface.fill(self.theme.background)
-		pygame.draw.ellipse(surface, self.theme.shadow, (0, int(self.display_height * 0.8), self.display_width, int(self.display_height * 0.4)))
-		surface.blit(pygame.transform.scale(self.theme.board, (self.board_width, self.board_height)), (self.board_start_x, self.board_start_y))
+		surface -- The pygame surface to draw on
+		region -- The rectangle to redraw
+		"""
 
-		# Render each cell
+		surface.set_clip(region)
+		surface.blit(self.get_static_layer(), region, region)
+		plain: pygame.Surface = self.get_static_layer(False)
+		size: Tuple[int, int] = ((self.radius - 1) * 2, (self.radius - 1) * 2)
 		for c in range(c4gui.MAX_COLS):
 			for r in range(c4gui.MAX_ROWS):
-				x = self.grid_start_x + c * self.tile_size + c4gui.styles.X_STRETCH * c
-				y = self.grid_start_y + r * self.tile_size + c4gui.styles.Y_STRETCH * r
-				if self.boards[board][r][c] == " ":
+				letter: str = self.frame_cells[r][c]
+				if letter != " ":
+					rect: pygame.Rect = self.get_cell_rect(r, c)
+					if rect.colliderect(region):
+						surface.blit(plain, rect, rect)
+						surface.blit(self.get_sprite("token", size, self.players.p1_color if letter == "X" else self.players.p2_color), rect)
+		if self.frame_drop is not None and self.frame_drop[0].colliderect(region):
+			surface.blit(self.get_sprite("token", size, self.frame_drop[1]), self.frame_drop[0])
+		if self.frame_text_rect.colliderect(region):
+			surface.blit(self.frame_text_surface, self.frame_text_rect)
+		if self.frame_hover is not None and self.frame_hover[0].colliderect(region):
+			surface.blit(self.get_sprite("token", size, self.frame_hover[1], True), self.frame_hover[0])
+		surface.set_clip(None)
 
-					# Blank spots get rendered as images through rectangles
-					surface.blit(pygame.transform.scale(self.theme.empty, ((self.radius - 1) * 2, (self.radius - 1) * 2)), (int(x + c4gui.styles.SPRITE_SCALE * self.scale), int(y + c4gui.styles.SPRITE_SCALE * self.scale)))
-
-				else:
-
-					# Filled spots get rendered as circles, which require an offset
-					color = self.players.p1_color if self.boards[board][r][c] == "X" else self.players.p2_color
-					surface.blit(pygame.transform.scale(c4gui.styles.get_color_from_tuple(color, True, False), ((self.radius - 1) * 2, (self.radius - 1) * 2)), (int(x + c4gui.styles.SPRITE_SCALE * self.scale), int(y + c4gui.styles.SPRITE_SCALE * self.scale)))
-
-	def draw_hovering_token(self, surface: pygame.Surface, x_pos: int, color: Tuple[int, int, int]) -> None:
+	def draw_board(self, surface: pygame.Surface, board: int = -1) -> None:
 		"""
-		Draw the token above the game board onto a surface
+		Draw the board onto a surface
 
 		surface -- The pygame surface to draw on
-		x_pos -- The horizontal component where the user's mouse is
-		color -- The RGB value for the token
+		board -- The board index to display (defaults to the most recent)
 		"""
-		#pygame.draw.circle(surface, color, (x_pos, int(self.tile_size / 2)), self.radius)
-		surface.blit(pygame.transform.scale(c4gui.styles.get_color_from_tuple(color, True, True), ((self.radius - 1) * 2, (self.radius - 1) * 2)), (x_pos - self.tile_size / 2, 0))
+
+		# Render the background, board and empty cells in one copy
+		surface.blit(self.get_static_layer(), (0, 0))
+		plain: pygame.Surface = self.get_static_layer(False)
+
+		# Filled spots replace the empty cell image with a token
+		size: Tuple[int, int] = ((self.radius - 1) * 2, (self.radius - 1) * 2)
+		tokens: Dict[str, pygame.Surface] = {"X": self.get_sprite("token", size, self.players.p1_color),
+											 "O": self.get_sprite("token", size, self.players.p2_color)}
+		for c in range(c4gui.MAX_COLS):
+			for r in range(c4gui.MAX_ROWS):
+				if self.boards[board][r][c] != " ":
+					rect: pygame.Rect = self.get_cell_rect(r, c)
+					surface.blit(plain, rect, rect)
+					surface.blit(tokens[self.boards[board][r][c]], rect)
+
+		# The screen no longer shows the last frame
+		self.frame_cells = None
 
 	def draw_review_text(self, surface: pygame.Surface, turn: int):
 		"""
@@ -248,7 +458,7 @@ class Game:
 		# Iterate and render items from the list
 		for button in buttons:
 			result[button] = c4gui.Coordinates(x=offset, y=int(self.display_height - button_dimension))
-			surface.blit(pygame.transform.scale(getattr(self.theme.icons, button), (button_dimension, button_dimension)), (result[button].x, result[button].y))
+			surface.blit(self.get_sprite("icons." + button, (button_dimension, button_dimension)), (result[button].x, result[button].y))
 			offset += 2 * button_dimension
 
 		return result
@@ -266,7 +476,7 @@ class Game:
 		try:
 			icon: pygame.image = getattr(self.theme.icons_hover, button)
 			if icon is not None:
-				surface.blit(pygame.transform.scale(icon, (dimension, dimension)), (coordinates.x, coordinates.y))
+				surface.blit(self.get_sprite("icons_hover." + button, (dimension, dimension)), (coordinates.x, coordinates.y))
 		except AttributeError:
 			pass
 
@@ -327,90 +537,93 @@ class Game:
 			raise TypeError("invalid game end callback")
 
 		# Draw the first blank
-		self.draw_board(surface)
-		self.draw_turn(surface, p1turn)
-		pygame.display.flip()
-
-		# Loop until a user triggers callback or the game ends
-		delay: int = c4gui.CPU_DELAY if self.game_type == GameType.SPECTATE else 0
-		while self.winner == Winner.NONE:
-
-			# Handle and remove all events from the pygame queue from the last tick
-			events: list = pygame.event.get()
-			for event in events:
-
-				# Redraw the board
-				self.draw_board(surface)
-				self.draw_turn(surface, p1turn)
+		self.frame_cells = None
+
+		# Loop until a user triggers callback or the game ends and the last token lands; pauses and drops run on the scheduler's frame clock
+		scheduler: c4gui.scheduler.Scheduler = c4gui.scheduler.Scheduler()
+		pause: c4gui.scheduler.Timer = scheduler.after(c4gui.CPU_DELAY) if self.game_type == GameType.SPECTATE else None
+		thinking: bool = False
+		hover_x: int = None
+		while self.winner == Winner.NONE or self.dropping():
+
+			# Push only the parts of the screen that changed; an idle frame pushes nothing
+			pygame.display.update(self.draw_frame(surface, p1turn, hover_x))
+
+			# Sleep until an event or the next timer, unless this frame has work that does not arrive as an event
+			computer_turn: bool = self.game_type == GameType.SPECTATE or self.game_type == GameType.SINGLE and not p1turn
+			network_turn: bool = (self.game_type == GameType.HOST and not p1turn) or (self.game_type == GameType.JOIN and p1turn)
+			paused: bool = pause is not None and not pause.done
+			if scheduler.animating() or not paused and (network_turn or computer_turn and not thinking):
+				events: list = pygame.event.get()
+			else:
+				events: list = c4gui.wait_events(scheduler.until_next())
+			scheduler.advance(clock.tick(c4gui.ANIMATION_TICKSPEED if scheduler.animating() else c4gui.TICKSPEED))
+
+			# Handle all events from the last frame, with the mouse motion merged
+			for event in c4gui.coalesce_events(events):
 
 				# check for SIGINT
 				c4gui.check_sigint(event)
 
-				# Handle natural pauses while still properly rendering the scene
-
-				# TODO - Right now this delays by a number of rendering iterations, but it would be better to use asynch time-based delays
-				if delay > 0:
-					delay -= 1
+				# Keep the hovering token under the mouse; it is only drawn while a local player can move
+				if event.type == pygame.MOUSEMOTION:
+					hover_x = event.pos[0]
 
-				else:
+				# Ignore moves during a natural pause or while a token falls, while still properly rendering the scene
+				if self.winner != Winner.NONE or self.dropping() or pause is not None and not pause.done:
+					continue
 
-					# TODO - Move these turn events outside of pygame events loop; the only dependent turn event is the user's turn
+				# User's turn
+				if self.game_type == GameType.DOUBLE or (p1turn and (self.game_type in [GameType.SINGLE, GameType.HOST])) or (not p1turn and self.game_type == GameType.JOIN):
 
-					# User's turn
-					if self.game_type == GameType.DOUBLE or (p1turn and (self.game_type in [GameType.SINGLE, GameType.HOST])) or (not p1turn and self.game_type == GameType.JOIN):
+					if event.type == pygame.MOUSEBUTTONDOWN and event.button == c4gui.Mouse.LEFT:
 
-						if event.type == pygame.MOUSEMOTION:
-
-							# Draw the x position of the mouse for a token hover effect
-							self.draw_hovering_token(surface, event.pos[0], self.players.p1_color if p1turn else self.players.p2_color)
-
-						elif event.type == pygame.MOUSEBUTTONDOWN and event.button == c4gui.Mouse.LEFT:
-
-							# Check if the mouse clicked within a tile relative to the valid list of columns
-							column: int = math.floor((event.pos[0] - self.grid_start_x) / self.tile_size)
-							if column in range(c4gui.MAX_COLS) and move_callback.human(self, p1turn, column):
-								if self.game_type in [GameType.HOST,GameType.JOIN]:
-									self.network.send(column)
-								p1turn = self.end_turn(p1turn)
-								delay = c4gui.CPU_DELAY
-
-							else:
-
-								# The move was illegal; render as normal
-								c4gui.sfx.play("invalid")
-								self.draw_hovering_token(surface, event.pos[0], self.players.p1_color if p1turn else self.players.p2_color)
-
-					# Computer's turn
-					elif self.game_type == GameType.SPECTATE or self.game_type == GameType.SINGLE and not p1turn:
-						move_callback.computer(self, p1turn)
-						p1turn = self.end_turn(p1turn)
-						if self.game_type == GameType.SPECTATE:
-							delay = c4gui.CPU_DELAY
-
-						# Force another redraw so the user doesn't have to invoke an event to see changes
-						self.draw_board(surface)
-						self.draw_turn(surface, p1turn)
-
-					# User-over-the-network's turn
-					elif (self.game_type == GameType.HOST and not p1turn) or (self.game_type == GameType.JOIN and p1turn):
-						column = self.network.receive()
-						if column is not None:
-							move_callback.human(self,p1turn,column)
+						# Check if the mouse clicked within a tile relative to the valid list of columns
+						column: int = math.floor((event.pos[0] - self.grid_start_x) / self.tile_size)
+						if column in range(c4gui.MAX_COLS) and move_callback.human(self, p1turn, column):
+							if self.game_type in [GameType.HOST,GameType.JOIN]:
+								self.network.send(column)
 							p1turn = self.end_turn(p1turn)
-
-						# Force another redraw so the user doesn't have to invoke an event to see changes
-						self.draw_board(surface)
-						self.draw_turn(surface, p1turn)
-
-			# If no events happened but one is required to make a move (e.g. computers), force trigger an event
-			if len(events) == 0 and (self.game_type == GameType.SPECTATE or self.game_type == GameType.SINGLE and not p1turn):
-				pygame.event.post(pygame.event.Event(pygame.USEREVENT, {}))
-
-			# Render the whole screen
-			pygame.display.flip()
-			clock.tick(c4gui.TICKSPEED)
-
-		# Set up the game over / review state
+							self.start_drop(scheduler)
+							pause = scheduler.after(c4gui.CPU_DELAY)
+
+						else:
+
+							# The move was illegal; render as normal
+							c4gui.sfx.play("invalid")
+							hover_x = event.pos[0]
+
+				# Computer's turn; its move arrives as an event once the background search finishes
+				elif thinking and event.type == pygame.USEREVENT and getattr(event, "user_type", None) == "CPU_MOVE":
+					if event.error is not None:
+						raise event.error
+					thinking = False
+					move_callback.human(self, p1turn, event.column)
+					p1turn = self.end_turn(p1turn)
+					self.start_drop(scheduler)
+					if self.game_type == GameType.SPECTATE:
+						pause = scheduler.after(c4gui.CPU_DELAY)
+
+			# Start computer searches and poll the network once any pause is over and the last token has landed
+			if self.winner != Winner.NONE or self.dropping() or pause is not None and not pause.done:
+				continue
+
+			# Computer's turn: start a search in the background, and keep rendering until its move arrives as an event
+			if self.game_type == GameType.SPECTATE or self.game_type == GameType.SINGLE and not p1turn:
+				if not thinking:
+					move_callback.computer(self, p1turn)
+					thinking = True
+
+			# User-over-the-network's turn
+			elif (self.game_type == GameType.HOST and not p1turn) or (self.game_type == GameType.JOIN and p1turn):
+				column = self.network.receive()
+				if column is not None:
+					move_callback.human(self,p1turn,column)
+					p1turn = self.end_turn(p1turn)
+					self.start_drop(scheduler)
+
+		# Set up the game over / review state, dropping any pause left from the last move
+		scheduler.clear()
 		max_board_num = len(self.boards) - 1
 		current_board_num = max_board_num
 		nav_buttons = (("nav_first", -2),
@@ -419,33 +632,31 @@ class Game:
 						("nav_next", 1),
 						("nav_last", 2))
 		button_dimension = self.get_icon_dimension()
+		nav_buttons_pos: Dict[str, c4gui.Coordinates] = None
+		exit_button: pygame.Rect = None
 
 		play_sound: bool = True
 		exit_game: bool = False
+		redraw: bool = True
+		mouse: Tuple[int, int] = None
+		locked: c4gui.scheduler.Timer = None
 		while not exit_game:
 
-			# Handle and remove all events from the pygame queue from the last tick
-			for event in pygame.event.get():
-
-				# Redraw the board
-				self.draw_board(surface, current_board_num)
-
-				# Redraw review features
-				self.draw_review_text(surface, current_board_num)
-				self.draw_win_status(surface, self.winner)
-				nav_buttons_pos = self.draw_review_buttons(surface, tuple([x[0] for x in nav_buttons]))
-				exit_button = self.draw_exit_button(surface)
+			# Sleep until an event arrives or the end of game pause is over, then handle them with the mouse motion merged
+			events: list = c4gui.coalesce_events(c4gui.wait_events(scheduler.until_next()) if not redraw else pygame.event.get())
+			for event in events:
+				redraw = True
 
+				# Let the game end sound play out before the review takes clicks
+				if locked is not None and not locked.done and event.type == pygame.MOUSEBUTTONDOWN:
+					continue
 				if event.type == pygame.MOUSEMOTION or (event.type == pygame.MOUSEBUTTONDOWN and event.button == c4gui.Mouse.LEFT):
+					mouse = event.pos
 
-					# Handle navigation buttons
-					for button in nav_buttons_pos.keys():
-						if pygame.Rect(nav_buttons_pos[button].x, nav_buttons_pos[button].y, button_dimension, button_dimension).collidepoint(event.pos[0], event.pos[1]):
-
-							# Highlight if hovered over
-							self.draw_highlight_button(surface, button_dimension, button, nav_buttons_pos[button])
-
-							if event.type == pygame.MOUSEBUTTONDOWN:
+					# Handle navigation buttons, as they were placed by the last render
+					if event.type == pygame.MOUSEBUTTONDOWN and nav_buttons_pos is not None:
+						for button in nav_buttons_pos.keys():
+							if pygame.Rect(nav_buttons_pos[button].x, nav_buttons_pos[button].y, button_dimension, button_dimension).collidepoint(event.pos[0], event.pos[1]):
 
 								# Change the board number if clicked
 								direction = int(dict(nav_buttons)[button])
@@ -465,17 +676,32 @@ class Game:
 									c4gui.sfx.play("special")
 
 					# Check exit button events
-					if exit_button.collidepoint(event.pos[0], event.pos[1]):
-						if event.type == pygame.MOUSEMOTION:
-							self.draw_exit_button(surface, True)
-						elif event.type == pygame.MOUSEBUTTONDOWN and event.button == c4gui.Mouse.LEFT:
-							end_callback()
-							exit_game = True
-							break
+					if event.type == pygame.MOUSEBUTTONDOWN and exit_button is not None and exit_button.collidepoint(event.pos[0], event.pos[1]):
+						end_callback()
+						exit_game = True
+						break
+
+			# Render once per tick, and only when something may have changed
+			if redraw and not exit_game:
+				redraw = False
+				self.draw_board(surface, current_board_num)
+
+				# Redraw review features
+				self.draw_review_text(surface, current_board_num)
+				self.draw_win_status(surface, self.winner)
+				nav_buttons_pos = self.draw_review_buttons(surface, tuple([x[0] for x in nav_buttons]))
+				exit_button = self.draw_exit_button(surface)
+
+				# Highlight whatever the mouse is over
+				if mouse is not None:
+					for button in nav_buttons_pos.keys():
+						if pygame.Rect(nav_buttons_pos[button].x, nav_buttons_pos[button].y, button_dimension, button_dimension).collidepoint(mouse[0], mouse[1]):
+							self.draw_highlight_button(surface, button_dimension, button, nav_buttons_pos[button])
+					if exit_button.collidepoint(mouse[0], mouse[1]):
+						self.draw_exit_button(surface, True)
 
 				# Render the whole screen
 				pygame.display.flip()
-				clock.tick(c4gui.TICKSPEED)
 
 				# Play a game end sound after the first render
 				if play_sound:
@@ -489,5 +715,6 @@ class Game:
 						c4gui.sfx.play("win")
 					elif self.winner == Winner.P2:
 						c4gui.sfx.play("lose")
-					pygame.time.delay(2500)
+					locked = scheduler.after(c4gui.END_DELAY)
 					play_sound = False
+			scheduler.advance(clock.tick(c4gui.TICKSPEED))
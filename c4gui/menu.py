@@ -484,7 +484,9 @@ class Menu:
 		# Loop until a user triggers callback
 		while True:
 
-			time_delta = clock.tick(60) / 1000.0
+			# Tick once per frame; the menu is rebuilt at most once per frame, after every event has been handled
+			time_delta = clock.tick(c4gui.TICKSPEED) / 1000.0
+			regenerate_menu: bool = False
 
 			# Handle network events
 			if self.network is not None:
@@ -506,11 +508,11 @@ class Menu:
 					else:
 						self.network_data = network_data
 
-					self.generate()
+					regenerate_menu = True
 
-			# Handle and remove all events from the pygame queue from the last tick
+			# Handle and remove all events from the pygame queue from the last tick, with the mouse motion merged
 			# https://github.com/pygame/pygame/blob/e40d00db1f8015e8f37624f83a0bd334547cd8dc/docs/reST/ref/event.rst
-			for event in pygame.event.get():
+			for event in c4gui.coalesce_events(pygame.event.get()):
 
 				# check for SIGINT
 				c4gui.check_sigint(event)
@@ -634,12 +636,13 @@ class Menu:
 						else:
 							regenerate = False
 
-						# Regenerate the menu elements
-						if regenerate:
-							self.generate()
+						# Regenerate the menu elements once this frame's events are handled
+						regenerate_menu = regenerate_menu or regenerate
 
 				self.manager.process_events(event)
 
+			if regenerate_menu:
+				self.generate()
 			self.manager.update(time_delta)
 
 			# Draw the background, logo, and theme button
@@ -651,4 +654,3 @@ class Menu:
 			# Render the drawing
 			self.manager.draw_ui(surface)
 			pygame.display.update()
-			clock.tick(c4gui.TICKSPEED)
@@ -0,0 +1,182 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+from typing import Callable
+
+
+def linear(progress: float) -> float:
+	"""
+	Ease at a constant rate
+
+	progress -- The fraction of the duration passed, from 0 to 1
+	"""
+
+	return progress
+
+
+def ease_in(progress: float) -> float:
+	"""
+	Ease from rest with constant acceleration, like a falling body
+
+	progress -- The fraction of the duration passed, from 0 to 1
+	"""
+
+	return progress * progress
+
+
+class Timer:
+	"""A callback due once a scheduler's clock reaches a deadline"""
+
+	def __init__(self, deadline: float, callback: Callable = None) -> None:
+		"""
+		Set up a timer; use Scheduler.after or Scheduler.at to create one
+
+		deadline -- The scheduler time in milliseconds the timer is due
+		callback -- An optional function without arguments called when the timer is due
+		"""
+
+		self.deadline: float = deadline
+		self.callback: Callable = callback
+		self.done: bool = False
+
+	def update(self, now: float) -> None:
+		"""
+		Fire the timer if it is due
+
+		now -- The scheduler time in milliseconds
+		"""
+
+		if now >= self.deadline:
+			self.done = True
+			if self.callback is not None:
+				self.callback()
+
+	def cancel(self) -> None:
+		"""Stop the timer without calling its callback"""
+
+		self.done = True
+		self.callback = None
+
+
+class Tween(Timer):
+	"""A value eased from a start to an end on a scheduler's clock"""
+
+	def __init__(self, start_time: float, duration: float, start: float, end: float, easing: Callable = linear, callback: Callable = None) -> None:
+		"""
+		Set up a tween; use Scheduler.tween to create one
+
+		start_time -- The scheduler time in milliseconds the tween starts
+		duration -- The milliseconds the tween takes
+		start -- The value at the start
+		end -- The value at the end
+		easing -- A function mapping the fraction of the duration passed to the fraction of the distance covered
+		callback -- An optional function without arguments called once the end is reached
+		"""
+
+		super().__init__(start_time + duration, callback)
+		self.start_time: float = start_time
+		self.duration: float = duration
+		self.start: float = start
+		self.end: float = end
+		self.easing: Callable = easing
+		self.value: float = start
+
+	def update(self, now: float) -> None:
+		"""
+		Move the value to where it is at a time, and finish once the end is reached
+
+		now -- The scheduler time in milliseconds
+		"""
+
+		progress: float = min(1.0, (now - self.start_time) / self.duration) if self.duration > 0 else 1.0
+		self.value = self.start + (self.end - self.start) * self.easing(progress)
+		if progress >= 1:
+			self.value = self.end
+			super().update(now)
+
+
+class Scheduler:
+	"""
+	Timers and tweens on a clock advanced by the frame delta
+
+	The clock only moves when advance is called, normally with the milliseconds pygame.time.Clock.tick measured, so
+	everything scheduled follows the same monotonic frame time however many events each frame handles
+	"""
+
+	def __init__(self) -> None:
+		"""Set up an empty scheduler at time 0"""
+
+		self.now: float = 0
+		self.timers: list = []
+
+	def at(self, deadline: float, callback: Callable = None) -> Timer:
+		"""
+		Schedule a timer at a scheduler time
+
+		deadline -- The scheduler time in milliseconds
+		callback -- An optional function without arguments called when the timer is due
+		"""
+
+		timer: Timer = Timer(deadline, callback)
+		self.timers.append(timer)
+		return timer
+
+	def after(self, delay: float, callback: Callable = None) -> Timer:
+		"""
+		Schedule a timer after a delay
+
+		delay -- The milliseconds from now
+		callback -- An optional function without arguments called when the timer is due
+		"""
+
+		return self.at(self.now + delay, callback)
+
+	def tween(self, duration: float, start: float, end: float, easing: Callable = linear, callback: Callable = None) -> Tween:
+		"""
+		Schedule a value to move from a start to an end, starting now
+
+		duration -- The milliseconds the tween takes
+		start -- The value at the start
+		end -- The value at the end
+		easing -- A function mapping the fraction of the duration passed to the fraction of the distance covered
+		callback -- An optional function without arguments called once the end is reached
+		"""
+
+		tween: Tween = Tween(self.now, duration, start, end, easing, callback)
+		self.timers.append(tween)
+		return tween
+
+	def advance(self, delta: float) -> None:
+		"""
+		Move the clock forward, updating tweens and firing due timers in deadline order
+
+		delta -- The milliseconds passed since the last call
+		"""
+
+		self.now += max(0, delta)
+
+		# Callbacks may schedule more timers, which wait for the next advance
+		for timer in sorted(self.timers, key=lambda t: t.deadline):
+			if not timer.done:
+				timer.update(self.now)
+		self.timers = [timer for timer in self.timers if not timer.done]
+
+	def animating(self) -> bool:
+		"""Check if a tween is running, so frames must keep coming"""
+
+		return any(isinstance(timer, Tween) and not timer.done for timer in self.timers)
+
+	def until_next(self) -> float:
+		"""Get the milliseconds until the next timer is due, 0 if one is already due, or None if nothing is scheduled"""
+
+		deadlines: list = [timer.deadline for timer in self.timers if not timer.done]
+		if not deadlines:
+			return None
+		return max(0, min(deadlines) - self.now)
+
+	def clear(self) -> None:
+		"""Cancel everything scheduled"""
+
+		for timer in self.timers:
+			timer.cancel()
+		self.timers = []
@@ -0,0 +1,292 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+import c4utils
+import math
+import random
+import time
+
+from array import array
+
+# The top cell of each column; a column is full once its top cell is taken
+TOP_CELLS: tuple = tuple(1 << (c * c4utils.COLUMN_HEIGHT + c4utils.MAX_ROWS - 1) for c in range(c4utils.MAX_COLS))
+
+# The lowest cell of each column, added to a mask to find the next free cell
+BOTTOM_CELLS: tuple = tuple(1 << (c * c4utils.COLUMN_HEIGHT) for c in range(c4utils.MAX_COLS))
+
+
+class Terminal:
+	NONE = 0
+	WIN = 1
+	DRAW = 2
+
+
+class MCTS:
+	"""
+	Monte Carlo tree search with UCT selection and random playouts on bitboards
+
+	Nodes live in parallel arrays indexed by node number rather than in per-node objects. A node stores the move that
+	leads to it, its children as a contiguous block, its visit count, and the reward of the player who made its move.
+	Positions are never stored; they are rebuilt by playing moves down from the root.
+	"""
+
+	# An optional object with an is_set() method; a search ends early once it is set
+	stop: any = None
+
+	def __init__(self, capacity: int = 1 << 20, exploration: float = math.sqrt(2), seed: int = None):
+		"""
+		Set up an empty tree
+
+		capacity -- the most nodes the pool holds; once full, leaves are scored by playouts without expanding
+		exploration -- the UCT exploration constant
+		seed -- an optional seed for reproducible playouts
+		"""
+
+		self.capacity: int = capacity
+		self.exploration: float = exploration
+		self.random: random.Random = random.Random(seed)
+		self.playouts: int = 0
+		self.reset()
+
+	def reset(self) -> None:
+		"""Empty the node pool; the next search starts a new tree"""
+
+		self.moves: array = array("b")
+		self.first_child: array = array("i")
+		self.child_count: array = array("b")
+		self.visits: array = array("i")
+		self.rewards: array = array("d")
+		self.terminal: array = array("b")
+		self.root: int = -1
+		self.root_bitboards: [int] = None
+		self.root_moves: int = 0
+
+	def allocate(self, move: int, terminal: int) -> int:
+		"""
+		Add a node to the pool
+
+		move -- the column played to reach the node
+		terminal -- a Terminal type for the position after the move
+
+		Returns the node number
+		"""
+
+		self.moves.append(move)
+		self.first_child.append(-1)
+		self.child_count.append(0)
+		self.visits.append(0)
+		self.rewards.append(0.0)
+		self.terminal.append(terminal)
+		return len(self.moves) - 1
+
+	def reuse(self, position: c4utils.Position) -> None:
+		"""
+		Make the node for a position the root, keeping its subtree from earlier searches
+
+		The new position must be the old root or up to two moves after it; otherwise the tree starts over
+
+		position -- the position about to be searched
+		"""
+
+		# Old subtrees stay in the pool, so start over before it fills up with them
+		bitboards: [int] = list(position.bitboards)
+		if self.root >= 0 and len(self.moves) <= self.capacity // 2 and 0 <= position.moves - self.root_moves <= 2:
+			if bitboards == self.root_bitboards:
+				return
+			old_turn: int = position.turn ^ ((position.moves - self.root_moves) & 1)
+			frontier: [(int, [int], int)] = [(self.root, list(self.root_bitboards), old_turn)]
+			for ply in range(2):
+				children: [(int, [int], int)] = []
+				for node, node_bitboards, turn in frontier:
+					heights: [int] = self.heights(node_bitboards)
+					for child in range(self.first_child[node], self.first_child[node] + self.child_count[node]):
+						child_bitboards: [int] = list(node_bitboards)
+						child_bitboards[turn] |= 1 << heights[self.moves[child]]
+						if child_bitboards == bitboards:
+							self.root = child
+							self.root_bitboards = bitboards
+							self.root_moves = position.moves
+							return
+						children.append((child, child_bitboards, turn ^ 1))
+				frontier = children
+
+		self.reset()
+		self.root = self.allocate(-1, Terminal.NONE)
+		self.root_bitboards = bitboards
+		self.root_moves = position.moves
+
+	@staticmethod
+	def heights(bitboards: [int]) -> [int]:
+		"""
+		Find the next free bit in every column
+
+		bitboards -- the token masks of both players
+		"""
+
+		mask: int = bitboards[0] | bitboards[1]
+		return [((mask + BOTTOM_CELLS[c]) & c4utils.COLUMN_MASKS[c]).bit_length() - 1 if not mask & TOP_CELLS[c] else -1
+				for c in range(c4utils.MAX_COLS)]
+
+	def expand(self, node: int, current: int, mask: int) -> None:
+		"""
+		Allocate every child of a node at once, marking the moves that end the game
+
+		node -- the node to expand
+		current -- the token mask of the player to move at the node
+		mask -- the mask of every token at the node
+		"""
+
+		first: int = len(self.moves)
+		for col in c4utils.CENTER_ORDER:
+			if not mask & TOP_CELLS[col]:
+				move: int = (mask + BOTTOM_CELLS[col]) & c4utils.COLUMN_MASKS[col]
+				if c4utils.connected_four(current | move):
+					terminal: int = Terminal.WIN
+				elif (mask | move) & c4utils.BOARD_MASK == c4utils.BOARD_MASK:
+					terminal: int = Terminal.DRAW
+				else:
+					terminal: int = Terminal.NONE
+				self.allocate(col, terminal)
+		self.first_child[node] = first
+		self.child_count[node] = len(self.moves) - first
+
+	def select(self, node: int) -> int:
+		"""
+		Pick the child with the highest upper confidence bound; unvisited children come first
+
+		node -- an expanded node
+		"""
+
+		log_visits: float = math.log(self.visits[node])
+		best_child: int = -1
+		best_bound: float = -1.0
+		for child in range(self.first_child[node], self.first_child[node] + self.child_count[node]):
+			visits: int = self.visits[child]
+			if not visits:
+				return child
+			bound: float = self.rewards[child] / visits + self.exploration * math.sqrt(log_visits / visits)
+			if bound > best_bound:
+				best_child, best_bound = child, bound
+		return best_child
+
+	def playout(self, current: int, mask: int) -> float:
+		"""
+		Play random moves to the end of the game
+
+		current -- the token mask of the player to move
+		mask -- the mask of every token
+
+		Returns the reward for the player to move: 1 for a win, 0.5 for a draw, 0 for a loss
+		"""
+
+		choice = self.random.choice
+		reward: float = 1.0
+		while mask & c4utils.BOARD_MASK != c4utils.BOARD_MASK:
+			col: int = choice([c for c in range(c4utils.MAX_COLS) if not mask & TOP_CELLS[c]])
+			move: int = (mask + BOTTOM_CELLS[col]) & c4utils.COLUMN_MASKS[col]
+			if c4utils.connected_four(current | move):
+				return reward
+			current ^= mask
+			mask |= move
+			reward = 1.0 - reward
+		return 0.5
+
+	def iterate(self, current: int, mask: int) -> None:
+		"""
+		Run one selection, expansion, playout and backup from the root
+
+		current -- the token mask of the player to move at the root
+		mask -- the mask of every token at the root
+		"""
+
+		node: int = self.root
+		path: [int] = [node]
+		while self.first_child[node] >= 0 and not self.terminal[node]:
+			node = self.select(node)
+			move: int = (mask + BOTTOM_CELLS[self.moves[node]]) & c4utils.COLUMN_MASKS[self.moves[node]]
+			current, mask = current ^ mask, mask | move
+			path.append(node)
+
+		# The reward is for the player who moved into the node, which is not the player to move there
+		if self.terminal[node] == Terminal.WIN:
+			reward: float = 1.0
+		elif self.terminal[node] == Terminal.DRAW:
+			reward: float = 0.5
+		else:
+			if self.visits[node] and len(self.moves) + c4utils.MAX_COLS <= self.capacity:
+				self.expand(node, current, mask)
+				node = self.select(node)
+				move: int = (mask + BOTTOM_CELLS[self.moves[node]]) & c4utils.COLUMN_MASKS[self.moves[node]]
+				path.append(node)
+				if self.terminal[node] == Terminal.WIN:
+					reward: float = 1.0
+				elif self.terminal[node] == Terminal.DRAW:
+					reward: float = 0.5
+				else:
+					reward: float = self.playout(current ^ mask, mask | move)
+					reward = 1.0 - reward
+			else:
+				reward: float = 1.0 - self.playout(current, mask)
+			self.playouts += 1
+
+		for node in reversed(path):
+			self.visits[node] += 1
+			self.rewards[node] += reward
+			reward = 1.0 - reward
+
+	def search(self, position: c4utils.Position, time_ms: int = None, playouts: int = None) -> int:
+		"""
+		Search a position until a budget runs out
+
+		position -- the position to search; it must not be over
+		time_ms -- an optional wall-clock budget in milliseconds
+		playouts -- an optional number of iterations; with neither budget, 10000 iterations run
+
+		Returns the most visited column
+		"""
+
+		self.reuse(position)
+		current: int = position.bitboards[position.turn]
+		mask: int = position.mask()
+		if self.first_child[self.root] < 0:
+			self.visits[self.root] += 1
+			self.expand(self.root, current, mask)
+
+		# A move that wins at once needs no search
+		for child in range(self.first_child[self.root], self.first_child[self.root] + self.child_count[self.root]):
+			if self.terminal[child] == Terminal.WIN:
+				return self.moves[child]
+
+		if time_ms is None and playouts is None:
+			playouts = 10000
+		deadline: float = None if time_ms is None else time.monotonic() + time_ms / 1000
+		iterations: int = 0
+		while playouts is None or iterations < playouts:
+			if not iterations & 63 and (deadline is not None and time.monotonic() > deadline or self.stop is not None and self.stop.is_set()):
+				break
+			self.iterate(current, mask)
+			iterations += 1
+
+		best_child: int = max(range(self.first_child[self.root], self.first_child[self.root] + self.child_count[self.root]),
+							  key=lambda child: self.visits[child])
+		return self.moves[best_child]
+
+
+def cpu_algorithm_mcts(board: [[]], letter: chr, time_ms: int = None, playouts: int = None, tree: MCTS = None) -> (int, int):
+	"""
+	Monte Carlo Algorithm for CPU player
+
+	letter -- character to place
+	time_ms -- an optional time budget in milliseconds
+	playouts -- an optional number of playouts
+	tree -- an optional tree kept between moves, so the subtree of the position reached is reused
+
+	Returns the row and column of the placed token
+	"""
+
+	if c4utils.check_if_board_full(board) or c4utils.check_win(board):
+		raise ValueError("no move to make on a finished board")
+
+	tree = tree if tree is not None else MCTS()
+	col: int = tree.search(c4utils.Position.from_board(board, letter), time_ms, playouts)
+	return c4utils.drop_token(board, col, letter), col
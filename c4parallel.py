@@ -0,0 +1,137 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+import c4utils
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+# Each pool process keeps its own transposition table across searches; Zobrist keys make stale entries harmless
+_table: c4utils.TranspositionTable = None
+
+
+def search_column(position: c4utils.Position, col: int, depth: int, alpha: int, deadline: float = None) -> int:
+	"""
+	Search one root move; runs inside a pool process
+
+	position -- the root position
+	col -- the playable root column to search
+	depth -- plies to search, including the root move
+	alpha -- the best root score found so far; a column that cannot beat it may return any score up to alpha
+	deadline -- an optional time.monotonic() value after which SearchTimeout is raised
+
+	Returns the column's score for the root player
+	"""
+
+	global _table
+	if _table is None:
+		_table = c4utils.TranspositionTable()
+
+	position.play(col)
+	if position.has_won(position.turn ^ 1):
+		return c4utils.WIN_SCORE - position.moves
+	search: c4utils.Search = c4utils.Search(position, _table)
+	search.deadline = deadline
+	return -search.negamax(depth - 1, -c4utils.WIN_SCORE - 1, -alpha)
+
+
+class ParallelSearch:
+	"""
+	Root-split search across a pool of processes
+
+	The first root column is searched alone to set alpha, then every other column is searched at once against it,
+	which mostly only has to prove a column is no better. With a single worker the plain Search runs in this process.
+	"""
+
+	def __init__(self, workers: int = 1):
+		"""
+		Set up the search; the pool starts with the first parallel search
+
+		workers -- the number of processes to search with
+		"""
+
+		self.workers: int = max(workers, 1)
+		self.executor: ProcessPoolExecutor = None
+
+	def search_root(self, position: c4utils.Position, depth: int, first: int, deadline: float = None) -> (int, int):
+		"""
+		Search every root column to a fixed depth in the pool
+
+		position -- the root position
+		depth -- plies to search, including the root move
+		first -- the column to search first, such as the best one from a shallower search
+		deadline -- an optional time.monotonic() value after which SearchTimeout is raised
+
+		Returns a tuple of the best column and its score; ties go to the first column, then the more central one
+		"""
+
+		if self.executor is None:
+			self.executor = ProcessPoolExecutor(max_workers=self.workers)
+		columns: [int] = [col for col in c4utils.CENTER_ORDER if position.can_play(col)]
+		if first in columns:
+			columns.remove(first)
+			columns.insert(0, first)
+
+		best_col: int = columns[0]
+		best_score: int = self.executor.submit(search_column, position, best_col, depth, -c4utils.WIN_SCORE - 1, deadline).result()
+		futures: list = [(col, self.executor.submit(search_column, position, col, depth, best_score, deadline)) for col in columns[1:]]
+		try:
+			for col, future in futures:
+				score: int = future.result()
+				if score > best_score:
+					best_col, best_score = col, score
+		finally:
+			for col, future in futures:
+				future.cancel()
+		return best_col, best_score
+
+	def best_move(self, position: c4utils.Position, depth: int) -> (int, int):
+		"""
+		Search every root move to a fixed depth
+
+		position -- the position to search
+		depth -- plies to search, including the root move
+
+		Returns a tuple of the best column and its score, or -1 for the column if the game is already over
+		"""
+
+		if self.workers == 1 or position.is_full() or depth < 1 or position.has_won(position.turn ^ 1):
+			return c4utils.Search(position).best_move(depth)
+		return self.search_root(position, depth, -1)
+
+	def iterative_deepening(self, position: c4utils.Position, time_ms: int, max_depth: int = None) -> (int, int, int):
+		"""
+		Search one ply deeper at a time until the time budget runs out
+
+		position -- the position to search
+		time_ms -- the wall-clock budget in milliseconds
+		max_depth -- the deepest iteration to run; defaults to filling the board
+
+		Returns a tuple of the best column, its score, and the depth of the last completed iteration
+		"""
+
+		remaining: int = c4utils.CELLS - position.moves
+		max_depth = remaining if max_depth is None else min(max_depth, remaining)
+		if self.workers == 1 or max_depth < 1 or position.has_won(position.turn ^ 1):
+			return c4utils.Search(position).iterative_deepening(time_ms, max_depth)
+
+		deadline: float = time.monotonic() + time_ms / 1000
+		result: (int, int, int) = (-1, 0, 0)
+		for depth in range(1, max_depth + 1):
+
+			# Always finish the first iteration so there is a move to return
+			try:
+				col, score = self.search_root(position, depth, result[0], deadline if depth > 1 else None)
+			except c4utils.SearchTimeout:
+				break
+			result = (col, score, depth)
+			if abs(score) >= c4utils.WIN_SCORE - c4utils.CELLS or time.monotonic() > deadline:
+				break
+		return result
+
+	def shutdown(self) -> None:
+		"""Stop the pool processes"""
+
+		if self.executor is not None:
+			self.executor.shutdown()
+			self.executor = None
@@ -0,0 +1,231 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+import argparse
+import c4mcts
+import c4utils
+import json
+import math
+import os
+import random
+import time
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Engine algorithms and the settings each one reads
+ALGORITHMS: dict = {
+	"random": (),
+	"alphabeta": ("depth", "time"),
+	"mcts": ("playouts", "time"),
+	"perfect": ("time",)
+}
+
+
+def parse_engine(spec: str) -> dict:
+	"""
+	Read an engine configuration such as "alphabeta:depth=6", "alphabeta:time=50" or "mcts:playouts=2000"
+
+	spec -- the algorithm name, optionally followed by a colon and comma separated integer settings
+
+	Returns a dict of the algorithm and its settings
+	"""
+
+	algorithm, _, settings = spec.partition(":")
+	if algorithm not in ALGORITHMS:
+		raise ValueError("unknown algorithm: %s" % algorithm)
+	engine: dict = {"algorithm": algorithm}
+	for setting in filter(None, settings.split(",")):
+		name, _, value = setting.partition("=")
+		if name not in ALGORITHMS[algorithm]:
+			raise ValueError("%s has no %s setting" % (algorithm, name))
+		engine[name] = int(value)
+	if algorithm == "alphabeta" and "depth" not in engine and "time" not in engine:
+		raise ValueError("alphabeta needs a depth or a time")
+	return engine
+
+
+def engine_move(engine: dict, board: [[]], letter: chr) -> (int, int):
+	"""
+	Play one engine move on a board
+
+	engine -- an engine configuration from parse_engine
+	board -- the 2D game board
+	letter -- character to place
+
+	Returns the row and column of the placed token
+	"""
+
+	if engine["algorithm"] == "random":
+		return c4utils.cpu_algorithm_easy(board, letter)
+	if engine["algorithm"] == "alphabeta":
+		return c4utils.cpu_algorithm_hard(board, letter, engine.get("depth", c4utils.CELLS), engine.get("time"))
+	if engine["algorithm"] == "mcts":
+		return c4mcts.cpu_algorithm_mcts(board, letter, engine.get("time"), engine.get("playouts"))
+	return c4utils.cpu_algorithm_perfect(board, letter, engine.get("time"))
+
+
+def random_opening(plies: int, seed: int) -> [int]:
+	"""
+	Pick random opening moves that leave the game open
+
+	plies -- the number of moves
+	seed -- the seed; both games of a pair are given the same one
+
+	Returns the columns played
+	"""
+
+	generator: random.Random = random.Random(seed)
+	position: c4utils.Position = c4utils.Position()
+	while position.moves < plies:
+		columns: [int] = [col for col in range(c4utils.MAX_COLS) if position.can_play(col)]
+		generator.shuffle(columns)
+		for col in columns:
+			position.play(col)
+
+			# Never hand the player to move a finished game or a win in one
+			if not position.has_won(position.turn ^ 1) and not position.is_full() and not \
+					c4utils.winning_cells(position.bitboards[position.turn], position.mask()) & (position.mask() + c4utils.BOTTOM_MASK) & c4utils.BOARD_MASK:
+				break
+			position.undo()
+		else:
+			break
+	return list(position.history)
+
+
+def play_game(game: int, engines: (dict, dict), opening_plies: int, seed: int) -> dict:
+	"""
+	Play one game; runs inside a pool process
+
+	game -- the game number; even games give the first engine X and odd games give it O, after the same opening
+	engines -- the two engine configurations
+	opening_plies -- random moves played before the engines take over
+	seed -- the match seed
+
+	Returns the game record, with result 1, 0.5 or 0 for the first engine
+	"""
+
+	random.seed(seed * 1000003 + game)
+	opening: [int] = random_opening(opening_plies, seed * 1000003 + game // 2)
+	players: (dict, dict) = engines if game % 2 == 0 else engines[::-1]
+	board: [[]] = [[" "] * c4utils.MAX_COLS for row in range(c4utils.MAX_ROWS)]
+	moves: [int] = []
+	for col in opening:
+		c4utils.drop_token(board, col, c4utils.LETTERS[len(moves) % 2])
+		moves.append(col)
+
+	start: float = time.monotonic()
+	winner: int = -1
+	while len(moves) < c4utils.CELLS:
+		player: int = len(moves) % 2
+		row, col = engine_move(players[player], board, c4utils.LETTERS[player])
+		moves.append(col)
+		if c4utils.check_win_at(board, row, col):
+			winner = player
+			break
+
+	# Turn the winning letter into the winning engine
+	result: float = 0.5 if winner < 0 else float((winner == 0) == (game % 2 == 0))
+	return {"game": game, "first_engine_letter": c4utils.LETTERS[game % 2], "opening": opening, "moves": moves,
+			"result": result, "plies": len(moves), "seconds": time.monotonic() - start}
+
+
+def elo(wins: int, draws: int, losses: int) -> (float, float, float):
+	"""
+	Estimate an Elo difference from match results
+
+	wins, draws, losses -- the first engine's results
+
+	Returns a tuple of the Elo difference and the bounds of its 95% confidence interval; a bound is infinite once
+	the score it stands for is 0 or 1
+	"""
+
+	games: int = wins + draws + losses
+	if not games:
+		return 0.0, -math.inf, math.inf
+	score: float = (wins + draws / 2) / games
+	variance: float = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score ** 2) / games
+	margin: float = 1.96 * math.sqrt(variance / games)
+
+	def difference(expected: float) -> float:
+		"""Convert an expected score to an Elo difference"""
+
+		if expected <= 0:
+			return -math.inf
+		if expected >= 1:
+			return math.inf
+		return -400 * math.log10(1 / expected - 1)
+
+	return difference(score), difference(score - margin), difference(score + margin)
+
+
+def run(games: int, engines: (dict, dict), opening_plies: int = 4, workers: int = None, seed: int = 0, output: any = None) -> dict:
+	"""
+	Play a match between two engines across a pool of processes
+
+	games -- the number of games; colors alternate and each pair of games shares a random opening
+	engines -- the two engine configurations
+	opening_plies -- random moves played before the engines take over
+	workers -- the number of processes; defaults to one per core, and 1 plays in this process
+	seed -- the match seed, which fixes the openings
+	output -- an optional text file each game record is written to as a JSON line as soon as it finishes
+
+	Returns a summary of the first engine's wins, draws, losses and Elo difference
+	"""
+
+	workers = workers or os.cpu_count() or 1
+	wins: int = 0
+	draws: int = 0
+	losses: int = 0
+	start: float = time.monotonic()
+
+	def record(game: dict) -> None:
+		"""
+		Count a finished game and stream it out
+
+		game -- the game record
+		"""
+
+		nonlocal wins, draws, losses
+		if game["result"] == 1:
+			wins += 1
+		elif game["result"] == 0:
+			losses += 1
+		else:
+			draws += 1
+		if output is not None:
+			output.write(json.dumps(game) + "\n")
+			output.flush()
+
+	if workers == 1:
+		for game in range(games):
+			record(play_game(game, engines, opening_plies, seed))
+	else:
+		with ProcessPoolExecutor(max_workers=workers) as executor:
+			for future in as_completed([executor.submit(play_game, game, engines, opening_plies, seed) for game in range(games)]):
+				record(future.result())
+
+	difference, low, high = elo(wins, draws, losses)
+	return {"games": games, "wins": wins, "draws": draws, "losses": losses, "elo": difference, "elo_low": low,
+			"elo_high": high, "seconds": time.monotonic() - start}
+
+
+if __name__ == "__main__":
+	parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Play engine configurations against each other without a window")
+	parser.add_argument("games", type=int, help="number of games to play")
+	parser.add_argument("first", type=parse_engine, help="first engine, such as alphabeta:depth=6 or mcts:time=50")
+	parser.add_argument("second", type=parse_engine, help="second engine, such as random or perfect:time=500")
+	parser.add_argument("--opening", type=int, default=4, help="random moves before the engines take over")
+	parser.add_argument("--workers", type=int, default=None, help="processes to play in; defaults to one per core")
+	parser.add_argument("--seed", type=int, default=0, help="seed for the random openings")
+	parser.add_argument("--output", default=None, help="JSONL file for the game records")
+	args: argparse.Namespace = parser.parse_args()
+
+	output_file: any = open(args.output, "w") if args.output else None
+	try:
+		summary: dict = run(args.games, (args.first, args.second), args.opening, args.workers, args.seed, output_file)
+	finally:
+		if output_file is not None:
+			output_file.close()
+	print("%d games in %.1f s: +%d =%d -%d, Elo %+.1f (95%% CI %+.1f to %+.1f)" % (
+		summary["games"], summary["seconds"], summary["wins"], summary["draws"], summary["losses"],
+		summary["elo"], summary["elo_low"], summary["elo_high"]))
@@ -1,26 +1,286 @@
 #!/usr/bin/python3
 # -*- coding: utf8 -*-
 
-import c4gui
+import c4engine
 import random
-import copy
+import time
+from array import array
+from collections import namedtuple
 
+# Token letters indexed by player (X always moves first)
+LETTERS: tuple = ("X", "O")
 
-class Node:
-	"""Node object in c4utils hard algorithm move tree"""
-	score: int
-	alpha: int = -99999
-	beta: int = 99999
-	depth: int
-	board_state: [[]]
+# Board size, so modules without a display can share the geometry
+MAX_ROWS: int = c4engine.MAX_ROWS
+MAX_COLS: int = c4engine.MAX_COLS
+
+# Bitboard geometry: each column takes MAX_ROWS bits plus one empty sentinel bit on top
+CELLS: int = MAX_ROWS * MAX_COLS
+COLUMN_HEIGHT: int = MAX_ROWS + 1
+BOTTOM_MASK: int = sum(1 << (c * COLUMN_HEIGHT) for c in range(MAX_COLS))
+BOARD_MASK: int = BOTTOM_MASK * ((1 << MAX_ROWS) - 1)
+COLUMN_MASKS: tuple = tuple(((1 << MAX_ROWS) - 1) << (c * COLUMN_HEIGHT) for c in range(MAX_COLS))
+
+# Zobrist keys for every (player, bit) pair and for the player to move, seeded for reproducible hashes
+_zobrist_random = random.Random(0xC4)
+ZOBRIST: [[int]] = [[_zobrist_random.getrandbits(64) for bit in range(MAX_COLS * COLUMN_HEIGHT)] for player in range(len(LETTERS))]
+ZOBRIST_TURN: int = _zobrist_random.getrandbits(64)
+
+# The bit each bit moves to when the board is mirrored left to right, and the Zobrist keys of the mirrored bits,
+# so the hash of a position's mirror image can be kept up to date alongside its own
+MIRROR_BITS: tuple = tuple((MAX_COLS - 1 - bit // COLUMN_HEIGHT) * COLUMN_HEIGHT + bit % COLUMN_HEIGHT for bit in range(MAX_COLS * COLUMN_HEIGHT))
+MIRROR_ZOBRIST: [[int]] = [[ZOBRIST[player][MIRROR_BITS[bit]] for bit in range(MAX_COLS * COLUMN_HEIGHT)] for player in range(len(LETTERS))]
+
+# Columns from the center outwards, the static search order
+CENTER_ORDER: tuple = tuple(sorted(range(MAX_COLS), key=lambda col: abs(MAX_COLS // 2 - col)))
+
+# Every line of 4 cells as bit indices, and the windows each bit belongs to
+WINDOWS: [tuple] = [tuple((c + i * x_shift) * COLUMN_HEIGHT + r + i * y_shift for i in range(4))
+					for x_shift, y_shift in ((1, 0), (0, 1), (1, 1), (1, -1))
+					for c in range(MAX_COLS) for r in range(MAX_ROWS)
+					if 0 <= c + 3 * x_shift < MAX_COLS and 0 <= r + 3 * y_shift < MAX_ROWS]
+CELL_WINDOWS: [tuple] = [tuple(w for w in range(len(WINDOWS)) if bit in WINDOWS[w]) for bit in range(MAX_COLS * COLUMN_HEIGHT)]
+
+# Window contents are coded as X tokens * 5 + O tokens; a window only scores while one player alone occupies it
+WINDOW_WEIGHTS: tuple = (0, 1, 4, 16, 1000)
+WINDOW_STEP: tuple = (5, 1)
+WINDOW_SCORES: [int] = [0 if x and o else WINDOW_WEIGHTS[x] - WINDOW_WEIGHTS[o] for x in range(5) for o in range(5)]
+WINDOW_DELTAS: [[int]] = [[WINDOW_SCORES[code + step] - WINDOW_SCORES[code] if code + step < len(WINDOW_SCORES) else 0
+						   for code in range(len(WINDOW_SCORES))] for step in WINDOW_STEP]
+
+# Scores at or beyond WIN_SCORE - CELLS are forced wins
+WIN_SCORE: int = 1000000
+
+# Game-theoretic result for the player to move: value is 1, 0 or -1 for a win, draw or loss,
+# score is the exact solver score, move the best column and distance the plies left until the game ends
+Solution = namedtuple("Solution", "value score move distance")
+
+# One completed search iteration: its depth, wall time in seconds, nodes visited, root score and best column
+Iteration = namedtuple("Iteration", "depth seconds nodes score move")
+
+# Counters of a search so far: nodes visited, beta cutoffs and how many came from the first move tried,
+# transposition table hits and misses, the principal variation, every completed Iteration,
+# and the score of each root column in the last iteration, where columns that could not beat the best are upper bounds
+SearchStats = namedtuple("SearchStats", "nodes cutoffs first_move_cutoffs table_hits table_misses pv iterations root_scores")
+
+
+def winning_cells(bitboard: int, mask: int) -> int:
+	"""
+	Find the empty cells that would complete 4 in a row for a player
+
+	bitboard -- the token mask of the player
+	mask -- the mask of every token on the board
+	"""
+
+	# Three tokens directly below
+	cells: int = (bitboard << 1) & (bitboard << 2) & (bitboard << 3)
+
+	# Horizontal and both diagonal lines, with the gap at any of the 4 spots
+	for shift in (COLUMN_HEIGHT, COLUMN_HEIGHT - 1, COLUMN_HEIGHT + 1):
+		pairs: int = (bitboard << shift) & (bitboard << 2 * shift)
+		cells |= pairs & (bitboard << 3 * shift)
+		cells |= pairs & (bitboard >> shift)
+		pairs = (bitboard >> shift) & (bitboard >> 2 * shift)
+		cells |= pairs & (bitboard << shift)
+		cells |= pairs & (bitboard >> 3 * shift)
+	return cells & (BOARD_MASK ^ mask)
+
+
+def connected_four(bitboard: int) -> bool:
+	"""
+	Check if a bitboard contains 4 tokens in a row
+
+	bitboard -- the token mask of a single player
+	"""
+
+	# Vertical, horizontal, and both diagonal shifts
+	for shift in (1, COLUMN_HEIGHT, COLUMN_HEIGHT - 1, COLUMN_HEIGHT + 1):
+		pairs: int = bitboard & (bitboard >> shift)
+		if pairs & (pairs >> (2 * shift)):
+			return True
+	return False
+
+
+def mirror(bitboard: int) -> int:
+	"""
+	Mirror a bitboard left to right; columns never carry into each other, so this also mirrors Position.key() values
+
+	bitboard -- a mask of cells
+	"""
+
+	mirrored: int = 0
+	for c in range(MAX_COLS):
+		mirrored |= ((bitboard >> (c * COLUMN_HEIGHT)) & ((1 << COLUMN_HEIGHT) - 1)) << ((MAX_COLS - 1 - c) * COLUMN_HEIGHT)
+	return mirrored
+
+
+class Position:
+	"""Bitboard game position with make and unmake moves"""
+
+	__slots__ = ("bitboards", "heights", "moves", "turn", "history", "hash", "mirror_hash", "windows", "score")
 
 	def __init__(self):
-		self.children = []
+		"""
+		Set up an empty position with X to move
+
+		bitboards -- the token mask of each player, indexed like LETTERS
+		heights -- the bit index of the next free cell in each column
+		moves -- the number of tokens on the board
+		turn -- the index of the player to move
+		history -- the played columns, used to unmake moves
+		hash -- the incrementally updated Zobrist hash
+		mirror_hash -- the Zobrist hash of the position mirrored left to right
+		windows -- the coded token counts of every window in WINDOWS
+		score -- the sum of the window scores, positive when X is ahead
+		"""
+
+		self.bitboards: [int] = [0, 0]
+		self.heights: [int] = [c * COLUMN_HEIGHT for c in range(MAX_COLS)]
+		self.moves: int = 0
+		self.turn: int = 0
+		self.history: [int] = []
+		self.hash: int = 0
+		self.mirror_hash: int = 0
+		self.windows: [int] = [0] * len(WINDOWS)
+		self.score: int = 0
+
+	@classmethod
+	def from_board(cls, board: [[]], letter: chr = None) -> "Position":
+		"""
+		Convert a 2D game board into a position
+
+		board -- the 2D game board
+		letter -- the character to move; defaults to the letter implied by the token count
+		"""
+
+		position = cls()
+		for r in range(MAX_ROWS):
+			for c in range(MAX_COLS):
+				if board[r][c] != " ":
+					bit: int = c * COLUMN_HEIGHT + MAX_ROWS - 1 - r
+					player: int = LETTERS.index(board[r][c])
+					position.bitboards[player] |= 1 << bit
+					position.hash ^= ZOBRIST[player][bit]
+					position.mirror_hash ^= MIRROR_ZOBRIST[player][bit]
+					for w in CELL_WINDOWS[bit]:
+						position.score += WINDOW_DELTAS[player][position.windows[w]]
+						position.windows[w] += WINDOW_STEP[player]
+					position.heights[c] = max(position.heights[c], bit + 1)
+					position.moves += 1
+		position.turn = position.moves & 1 if letter is None else LETTERS.index(letter)
+		if position.turn:
+			position.hash ^= ZOBRIST_TURN
+			position.mirror_hash ^= ZOBRIST_TURN
+		return position
+
+	def to_board(self) -> [[]]:
+		"""Convert the position into a 2D game board"""
+
+		board: [[]] = [[" " for c in range(MAX_COLS)] for r in range(MAX_ROWS)]
+		for r in range(MAX_ROWS):
+			for c in range(MAX_COLS):
+				bit: int = 1 << (c * COLUMN_HEIGHT + MAX_ROWS - 1 - r)
+				if self.bitboards[0] & bit:
+					board[r][c] = LETTERS[0]
+				elif self.bitboards[1] & bit:
+					board[r][c] = LETTERS[1]
+		return board
+
+	def mask(self) -> int:
+		"""Get the mask of every token on the board"""
+
+		return self.bitboards[0] | self.bitboards[1]
+
+	def can_play(self, col: int) -> bool:
+		"""
+		Check if a token can be dropped into a column
+
+		col -- column to check
+		"""
+
+		return self.heights[col] < (col + 1) * COLUMN_HEIGHT - 1
+
+	def play(self, col: int) -> None:
+		"""
+		Drop a token for the player to move and pass the turn
+
+		col -- a playable column
+		"""
+
+		bit: int = self.heights[col]
+		player: int = self.turn
+		self.bitboards[player] |= 1 << bit
+		self.hash ^= ZOBRIST[player][bit] ^ ZOBRIST_TURN
+		self.mirror_hash ^= MIRROR_ZOBRIST[player][bit] ^ ZOBRIST_TURN
+		windows: [int] = self.windows
+		deltas: [int] = WINDOW_DELTAS[player]
+		step: int = WINDOW_STEP[player]
+		for w in CELL_WINDOWS[bit]:
+			self.score += deltas[windows[w]]
+			windows[w] += step
+		self.heights[col] = bit + 1
+		self.moves += 1
+		self.turn ^= 1
+		self.history.append(col)
+
+	def undo(self) -> int:
+		"""Take back the last move and return its column"""
+
+		col: int = self.history.pop()
+		self.turn ^= 1
+		self.moves -= 1
+		self.heights[col] -= 1
+		bit: int = self.heights[col]
+		player: int = self.turn
+		self.bitboards[player] ^= 1 << bit
+		self.hash ^= ZOBRIST[player][bit] ^ ZOBRIST_TURN
+		self.mirror_hash ^= MIRROR_ZOBRIST[player][bit] ^ ZOBRIST_TURN
+		windows: [int] = self.windows
+		deltas: [int] = WINDOW_DELTAS[player]
+		step: int = WINDOW_STEP[player]
+		for w in CELL_WINDOWS[bit]:
+			windows[w] -= step
+			self.score -= deltas[windows[w]]
+		return col
+
+	def has_won(self, player: int) -> bool:
+		"""
+		Check if a player has 4 in a row
+
+		player -- the index of the player in LETTERS
+		"""
+
+		return connected_four(self.bitboards[player])
+
+	def evaluate(self, player: int) -> int:
+		"""
+		Get the heuristic score of the position for a player
+
+		player -- the index of the player in LETTERS
+		"""
 
-	def set(self, s: int, d: int):
-		self.score = s
-		self.depth = d
-		self.children = []
+		return -self.score if player else self.score
+
+	def is_full(self) -> bool:
+		"""Check if every cell is taken"""
+
+		return self.moves == CELLS
+
+	def key(self) -> int:
+		"""Get a unique integer key for the position and the player to move"""
+
+		return self.bitboards[self.turn] + self.mask()
+
+	def canonical_key(self) -> (int, bool):
+		"""
+		Get the same key for the position and its mirror image: the smaller of their two keys
+
+		Returns a tuple of the key and True if it belongs to the mirror image, so columns stored with it must be mirrored
+		"""
+
+		key: int = self.bitboards[self.turn] + self.mask()
+		mirrored: int = mirror(key)
+		return (mirrored, True) if mirrored < key else (key, False)
 
 
 def check_if_column_full(board: [[]], col: int) -> bool:
@@ -47,6 +307,21 @@ def check_if_board_full(board: [[]]) -> bool:
 	return True
 
 
+def _bitboards_from_board(board: [[]]) -> [int]:
+	"""
+	Build only the token masks of a 2D game board, without the rest of a position
+
+	board -- the 2D game board
+	"""
+
+	bitboards: [int] = [0, 0]
+	for r in range(MAX_ROWS):
+		for c in range(MAX_COLS):
+			if board[r][c] != " ":
+				bitboards[LETTERS.index(board[r][c])] |= 1 << (c * COLUMN_HEIGHT + MAX_ROWS - 1 - r)
+	return bitboards
+
+
 def check_win(board: [[]]) -> bool:
 	"""
 	Check if a player has achieved 4 in a row
@@ -54,217 +329,705 @@ def check_win(board: [[]]) -> bool:
 	board -- the 2D game board
 	"""
 
-	directions: [[]] = [[1, 0], [1, -1], [1, 1], [0, 1]]
-	for i in directions:
-		y_shift: int = i[0]
-		x_shift: int = i[1]
-		for y in range(c4gui.MAX_ROWS):
-			for x in range(c4gui.MAX_COLS):
-				last_y: int = y + (3 * y_shift)
-				last_x: int = x + (3 * x_shift)
-				if 0 <= last_y < c4gui.MAX_ROWS and 0 <= last_x < c4gui.MAX_COLS:
-					string: str = board[y][x]
-					if string != " " and string == board[y + y_shift][x + x_shift] and string == board[y + 2 * y_shift][
-						x + 2 * x_shift] and string == board[last_y][last_x]:
-						return True
+	bitboards: [int] = _bitboards_from_board(board)
+	return connected_four(bitboards[0]) or connected_four(bitboards[1])
+
+
+def check_win_at(board: [[]], row: int, col: int) -> bool:
+	"""
+	Check if the token at a cell is part of 4 in a row
+	Only the lines through that cell are scanned, so pass the last placed token
+
+	board -- the 2D game board
+	row -- row of the token
+	col -- column of the token
+	"""
+
+	letter: chr = board[row][col]
+	if letter == " ":
+		return False
+
+	# Count matching tokens on both sides of the cell along each line
+	for y_shift, x_shift in ((0, 1), (1, 0), (1, 1), (1, -1)):
+		count: int = 1
+		for sign in (1, -1):
+			y: int = row + sign * y_shift
+			x: int = col + sign * x_shift
+			while count < 4 and 0 <= y < MAX_ROWS and 0 <= x < MAX_COLS and board[y][x] == letter:
+				count += 1
+				y += sign * y_shift
+				x += sign * x_shift
+		if count >= 4:
+			return True
 	return False
 
 
-def cpu_algorithm_easy(board: [[]], letter: chr) -> None:
+def drop_token(board: [[]], col: int, letter: chr) -> int:
+	"""
+	Drop a token into a column
+
+	board -- the 2D game board
+	col -- column to drop the token into
+	letter -- character to place
+
+	Returns the row the token landed in, or -1 if the column is full
+	"""
+
+	for row in range(MAX_ROWS - 1, -1, -1):
+		if board[row][col] == " ":
+			board[row][col] = letter
+			return row
+	return -1
+
+
+def cpu_algorithm_easy(board: [[]], letter: chr) -> (int, int):
 	"""
 	Easy Algorithm for CPU player (chooses column randomly)
 
 	letter -- character to place
+
+	Returns the row and column of the placed token
 	"""
 
 	random_choice: int = random.randint(0, 6)
 	while True:
 		if not check_if_column_full(board, random_choice):
-			for i in range(5, -1, -1):
-				if board[i][random_choice] == " ":
-					board[i][random_choice] = letter
-					return
+			return drop_token(board, random_choice, letter), random_choice
 		else:
 			random_choice = random.randint(0, 6)
 
 
-def cpu_algorithm_hard(board: [[]], letter: chr, depth: int) -> None:
+def evaluate_board(board: [[]], letter: chr) -> int:
 	"""
-	Hard Algorithm for CPU player
+	Evaluate board state
+	Sums a score over every line of 4 cells that only one player occupies
+	Increased score per line based on how many tokens it holds
 
-	letter -- character to place
-	depth -- search depth for how many future moves to calculate
+	board -- the 2D game board
+	letter -- character to score the board for
 	"""
 
-	# Store move letter for opponent
-	opponent = "O" if letter == "X" else "X"
+	return Position.from_board(board).evaluate(LETTERS.index(letter))
 
-	def evaluate_board(tmp: [[]], letter: chr) -> int:
+
+class Bound:
+	EXACT = 1
+	LOWER = 2
+	UPPER = 3
+
+
+class TranspositionTable:
+	"""
+	Fixed-size transposition table keyed by Zobrist hash with depth-preferred replacement
+
+	Slots live in two flat arrays of 64-bit integers, one of keys and one of entries, so a full table costs 16 bytes
+	per slot instead of a tuple and its integers. An entry packs (value << 16) | (depth << 8) | (bound << 4) | (move + 1),
+	which is never 0 for a stored entry since every bound is at least 1.
+	"""
+
+	def __init__(self, size_bits: int = 18):
 		"""
-		Evaluate board state
-		Calculates score of board state from number of chains each side has
-		Increased score per chain based on chain size
+		Allocate every slot up front
+
+		size_bits -- the table holds 2 ** size_bits entries
 		"""
 
-		count_good: int = 0
-		count_bad: int = 0
-		direction: [[]] = [[0, -1], [0, 1], [-1, 0], [-1, -1], [-1, 1], [1, 0], [1, -1], [1, 1]]
+		self.index_mask: int = (1 << size_bits) - 1
+		self.keys: array = array("Q", [0]) * (1 << size_bits)
+		self.entries: array = array("q", [0]) * (1 << size_bits)
 
-		for y in range(0, c4gui.MAX_ROWS):
+	def get(self, key: int) -> tuple:
+		"""
+		Look up an entry as a (depth, bound, value, move) tuple, or None if absent
+
+		key -- the Zobrist hash of the position
+		"""
 
-			for x in range(0, c4gui.MAX_COLS):
+		index: int = key & self.index_mask
+		entry: int = self.entries[index]
+		if entry and self.keys[index] == key:
+			return (entry >> 8) & 0xFF, (entry >> 4) & 0xF, entry >> 16, (entry & 0xF) - 1
+		return None
 
-				if tmp[y][x] == letter:
-					for i in direction:
-						y_shift = i[0]
-						x_shift = i[1]
+	def put(self, key: int, depth: int, bound: int, value: int, move: int) -> None:
+		"""
+		Store an entry unless its slot holds a deeper search of another position
 
-						# If 2 in a row
-						if 0 <= y + y_shift < c4gui.MAX_ROWS and 0 <= x + x_shift < c4gui.MAX_COLS and tmp[y + y_shift][x + x_shift] == letter:
-							count_good += 2
+		key -- the Zobrist hash of the position
+		depth -- the remaining search depth the value was computed with
+		bound -- a Bound type for the value
+		value -- the score for the player to move
+		move -- the best column found, or -1
+		"""
+
+		index: int = key & self.index_mask
+		entry: int = self.entries[index]
+		if entry and self.keys[index] != key and (entry >> 8) & 0xFF > depth:
+			return
+		self.keys[index] = key
+		self.entries[index] = (value << 16) | (depth << 8) | (bound << 4) | (move + 1)
+
+
+class SolverTable(TranspositionTable):
+	"""Transposition table for Position.key() style keys, which are not randomly distributed"""
+
+	def __init__(self, size: int = 1048573):
+		"""
+		Allocate every slot up front
+
+		size -- the number of entries; a prime spreads the structured keys evenly over the slots
+		"""
+
+		self.size: int = size
+		self.keys: array = array("Q", [0]) * size
+		self.entries: array = array("q", [0]) * size
+
+	def get(self, key: int) -> tuple:
+		"""
+		Look up an entry as a (depth, bound, value, move) tuple, or None if absent
+
+		key -- the unique key of the position
+		"""
+
+		index: int = key % self.size
+		entry: int = self.entries[index]
+		if entry and self.keys[index] == key:
+			return (entry >> 8) & 0xFF, (entry >> 4) & 0xF, entry >> 16, (entry & 0xF) - 1
+		return None
+
+	def put(self, key: int, depth: int, bound: int, value: int, move: int) -> None:
+		"""
+		Store an entry unless its slot holds a position with more empty cells
 
-							# If 3 in a row
-							if 0 <= y + 2 * y_shift < c4gui.MAX_ROWS and 0 <= x + 2 * x_shift < c4gui.MAX_COLS and tmp[y + 2 * y_shift][x + 2 * x_shift] == letter:
-								count_good += 9
-
-								# If 4 in a row
-								if 0 <= y + 3 * y_shift < c4gui.MAX_ROWS and 0 <= x + 3 * x_shift < c4gui.MAX_COLS and tmp[y + 3 * y_shift][x + 3 * x_shift] == letter:
-									count_good += 1000
-
-				if tmp[y][x] == opponent:
-					for i in direction:
-						y_shift = i[0]
-						x_shift = i[1]
-
-						# If 2 in a row for opponent
-						if 0 <= y + y_shift < c4gui.MAX_ROWS and 0 <= x + x_shift < c4gui.MAX_COLS and tmp[y + y_shift][
-							x + x_shift] == opponent:
-							count_bad += 4
-
-							# If 3 in a row for opponent
-							if 0 <= y + 2 * y_shift < c4gui.MAX_ROWS and 0 <= x + 2 * x_shift < c4gui.MAX_COLS and tmp[y + 2 * y_shift][x + 2 * x_shift] == opponent:
-								count_bad += 9
-
-								# If 4 in a row for opponent
-								if 0 <= y + 3 * y_shift < c4gui.MAX_ROWS and 0 <= x + 3 * x_shift < c4gui.MAX_COLS and tmp[y + 3 * y_shift][x + 3 * x_shift] == opponent:
-									count_bad += 9999
-
-		return count_good - count_bad
-
-	def a_b_pruning(node: Node) -> None:
-		"""
-		Recursive alpha beta pruning method
-
-		node -- Board object thats apart of game tree. Initially passed root node. 
-		"""
-
-		# Pruning check
-		if node.alpha < node.beta:
-
-			# Traverse to leaf depth - 1
-			if node.depth < depth - 1:
-				if node.depth % 2 == 0:
-
-					# Root node has no parent
-					if node.depth == 0:
-						for i in range(len(node.children)):
-							node.children[i].alpha = node.alpha
-							node.children[i].beta = node.beta
-							a_b_pruning(node.children[i])
-
-					# Max level
-					else:
-						for i in range(len(node.children)):
-							node.children[i].alpha = node.alpha
-							node.children[i].beta = node.beta
-							a_b_pruning(node.children[i])
-							if node.children[i].beta > node.alpha:
-								node.alpha = node.children[i].beta
-
-				# Min level
-				elif node.depth % 2 == 1:
-					for i in range(len(node.children)):
-						node.children[i].alpha = node.alpha
-						node.children[i].beta = node.beta
-						a_b_pruning(node.children[i])
-						if node.children[i].alpha < node.beta:
-							node.beta = node.children[i].alpha
-
-			# Evaluating each child for min or max
-			for child in node.children:
-
-				# Min level
-				if child.depth % 2 == 0:
-					if child.alpha < node.beta:
-						node.beta = child.alpha
-				elif child.depth % 2 == 1:
-					if child.beta > node.alpha:
-						node.alpha = child.beta
-
-	# Begin function execution
-	move_tree: list = []
-	tmp_score: int
-	tmp_board = copy.deepcopy(board)
-	original_board = copy.deepcopy(board)
-
-	# Create game tree for all possible moves
-	root: Node = Node()
-	root.depth = 0
-	root.score = evaluate_board(tmp_board, letter)
-	root.board_state = copy.deepcopy(original_board)
-	move_tree.append(root)
-
-	# Find remaining moves for given depth
-	for item in move_tree:
-		if item.depth < depth:
-
-			# Store all possible moves
-			for x in range(c4gui.MAX_COLS):
-
-				if not check_if_column_full(board, x):
-					for y in range(5, -1, -1):
-						if item.board_state[y][x] == " ":
-							if item.depth % 2 == 0:
-								player = letter
-							else:
-								player = opponent
-
-							# Candidate move found, store move
-							item.board_state[y][x] = player
-							tmp_node: Node = Node()
-							tmp_node.depth = item.depth + 1
-							tmp_node.board_state = copy.deepcopy(item.board_state)
-							tmp_node.parent = item
-
-							# Check for immediate win and terminate if found
-							if tmp_node.depth == 1 and check_win(tmp_node.board_state):
-								board[y][x] = letter
-								return
-
-							item.board_state[y][x] = ' '
-							move_tree.append(tmp_node)
-							item.children.append(tmp_node)
-							break
-
-	# Set alpha beta for leaf nodes
-	for i in reversed(range(len(move_tree))):
-		if move_tree[i].depth == depth:
-			move_tree[i].score = evaluate_board(move_tree[i].board_state, letter)
-			move_tree[i].alpha = move_tree[i].score
-			move_tree[i].beta = move_tree[i].score
+		key -- the unique key of the position
+		depth -- the number of empty cells
+		bound -- a Bound type for the value
+		value -- the solver score for the player to move
+		move -- the best column found, or -1
+		"""
+
+		index: int = key % self.size
+		entry: int = self.entries[index]
+		if entry and self.keys[index] != key and (entry >> 8) & 0xFF > depth:
+			return
+		self.keys[index] = key
+		self.entries[index] = (value << 16) | (depth << 8) | (bound << 4) | (move + 1)
+
+
+class SearchTimeout(Exception):
+	"""Raised inside a search once its deadline has passed"""
+
+
+class Search:
+	"""Depth-first negamax alpha-beta search over a bitboard position"""
+
+	# An optional object with an is_set() method, checked with the deadline; a search times out early once it is set
+	stop: any = None
+
+	def __init__(self, position: Position, table: TranspositionTable = None, ordering: bool = True, observer: callable = None):
+		"""
+		Set up a search; scores are always for the player to move
+
+		position -- the position to search; moves are made and unmade in place
+		table -- an optional transposition table to share between searches
+		ordering -- sort moves with the hash move, killer and history heuristics; disable to measure their gain
+		observer -- an optional function called with the SearchStats after every completed iteration
+		"""
+
+		self.position: Position = position
+		self.table: TranspositionTable = table if table is not None else TranspositionTable()
+		self.ordering: bool = ordering
+		self.observer: callable = observer
+		self.deadline: float = None
+		self.pv: [int] = []
+		self.lines: [[int]] = [[] for ply in range(CELLS + 1)]
+
+		# Two killer moves per ply and a history score per player and cell
+		self.killers: [[int]] = [[-1, -1] for ply in range(CELLS + 1)]
+		self.history: [[int]] = [[0] * (MAX_COLS * COLUMN_HEIGHT) for player in range(len(LETTERS))]
+
+		# Node and cutoff counts; a high share of first move cutoffs means good ordering
+		self.nodes: int = 0
+		self.cutoffs: int = 0
+		self.first_move_cutoffs: int = 0
+		self.table_hits: int = 0
+		self.table_misses: int = 0
+		self.iterations: [Iteration] = []
+		self.root_scores: dict = {}
+
+	def stats(self) -> SearchStats:
+		"""Get the counters of the search so far"""
+
+		return SearchStats(nodes=self.nodes, cutoffs=self.cutoffs, first_move_cutoffs=self.first_move_cutoffs,
+						   table_hits=self.table_hits, table_misses=self.table_misses, pv=list(self.pv),
+						   iterations=list(self.iterations), root_scores=dict(self.root_scores))
+
+	def evaluate(self) -> int:
+		"""Score a leaf for the player to move"""
+
+		return self.position.evaluate(self.position.turn)
+
+	def ordered_moves(self, ply: int, pv_move: int, hash_move: int) -> [int]:
+		"""
+		List the playable columns in search order
+
+		ply -- distance from the root
+		pv_move -- the column the previous principal variation played here, or -1
+		hash_move -- the best column stored in the transposition table, or -1
+		"""
+
+		position: Position = self.position
+		if not self.ordering:
+			return [col for col in range(MAX_COLS) if position.can_play(col)]
+
+		# Center-out order, stably re-sorted by history score
+		heights: [int] = position.heights
+		history: [int] = self.history[position.turn]
+		moves: [int] = [col for col in CENTER_ORDER if position.can_play(col)]
+		moves.sort(key=lambda col: history[heights[col]], reverse=True)
+
+		# Principal variation, hash and killer moves go first
+		first: [int] = []
+		for col in (pv_move, hash_move, self.killers[ply][0], self.killers[ply][1]):
+			if col in moves and col not in first:
+				first.append(col)
+		return first + [col for col in moves if col not in first]
+
+	def negamax(self, depth: int, alpha: int, beta: int, ply: int = 0, follow_pv: bool = False) -> int:
+		"""
+		Recursive negamax with alpha beta pruning and transposition lookups
+
+		depth -- remaining plies to search
+		alpha -- lower bound of the search window
+		beta -- upper bound of the search window
+		ply -- distance from the root
+		follow_pv -- True if every move so far matches the previous principal variation
+
+		Returns the score for the player to move
+		"""
+
+		self.nodes += 1
+		self.lines[ply] = []
+		if self.deadline is not None and not self.nodes & 1023 and (time.monotonic() > self.deadline or self.stop is not None and self.stop.is_set()):
+			raise SearchTimeout()
+
+		position: Position = self.position
+		if position.is_full():
+			return 0
+		if depth == 0:
+			return self.evaluate()
+
+		# Use a stored result if it was searched at least as deep; a position and its mirror image share an entry
+		alpha_start: int = alpha
+		mirrored: bool = position.mirror_hash < position.hash
+		key: int = position.mirror_hash if mirrored else position.hash
+		entry: tuple = self.table.get(key)
+		hash_move: int = -1
+		if entry is None:
+			self.table_misses += 1
+		else:
+			self.table_hits += 1
+			if entry[3] >= 0:
+				hash_move = MAX_COLS - 1 - entry[3] if mirrored else entry[3]
+			if entry[0] >= depth and ply > 0:
+				if entry[1] == Bound.EXACT:
+					return entry[2]
+				if entry[1] == Bound.LOWER:
+					alpha = max(alpha, entry[2])
+				else:
+					beta = min(beta, entry[2])
+				if alpha >= beta:
+					return entry[2]
+
+		best_score: int = -WIN_SCORE - 1
+		best_move: int = -1
+		pv_move: int = self.pv[ply] if follow_pv and ply < len(self.pv) else -1
+		for index, col in enumerate(self.ordered_moves(ply, pv_move, hash_move)):
+
+			# A move that connects four ends the game; earlier wins score higher
+			position.play(col)
+			if position.has_won(position.turn ^ 1):
+				score = WIN_SCORE - position.moves
+				self.lines[ply + 1] = []
+			else:
+				score = -self.negamax(depth - 1, -beta, -alpha, ply + 1, col == pv_move)
+			position.undo()
+			if not ply:
+				self.root_scores[col] = score
+
+			if score > best_score:
+				best_score = score
+				best_move = col
+				if score > alpha:
+					alpha = score
+					self.lines[ply] = [col] + self.lines[ply + 1]
+					if alpha >= beta:
+						self.cutoff(ply, col, depth, index)
+						break
+
+		if best_score <= alpha_start:
+			bound = Bound.UPPER
+		elif best_score >= beta:
+			bound = Bound.LOWER
+		else:
+			bound = Bound.EXACT
+		self.table.put(key, depth, bound, best_score, MAX_COLS - 1 - best_move if mirrored and best_move >= 0 else best_move)
+		return best_score
+
+	def cutoff(self, ply: int, col: int, depth: int, index: int) -> None:
+		"""
+		Record a beta cutoff in the killer and history tables
+
+		ply -- distance from the root
+		col -- the column that caused the cutoff
+		depth -- remaining plies at the node
+		index -- the position of the column in the search order
+		"""
+
+		self.cutoffs += 1
+		if index == 0:
+			self.first_move_cutoffs += 1
+		killers: [int] = self.killers[ply]
+		if killers[0] != col:
+			killers[1] = killers[0]
+			killers[0] = col
+		self.history[self.position.turn][self.position.heights[col]] += depth * depth
+
+	def best_move(self, depth: int) -> (int, int):
+		"""
+		Search every root move to a fixed depth
+
+		depth -- plies to search, including the root move
+
+		Returns a tuple of the best column and its score, or -1 for the column if the game is already over
+		"""
+
+		position: Position = self.position
+		if position.has_won(position.turn ^ 1):
+			self.pv = []
+			return -1, -(WIN_SCORE - position.moves)
+		if position.is_full() or depth < 1:
+			self.pv = []
+			return -1, 0
+
+		start: float = time.monotonic()
+		nodes: int = self.nodes
+		self.root_scores = {}
+		score: int = self.negamax(depth, -WIN_SCORE - 1, WIN_SCORE + 1, 0, True)
+		self.pv = self.lines[0]
+		self.iterations.append(Iteration(depth=depth, seconds=time.monotonic() - start, nodes=self.nodes - nodes, score=score, move=self.pv[0]))
+		if self.observer is not None:
+			self.observer(self.stats())
+		return self.pv[0], score
+
+	def iterative_deepening(self, time_ms: int, max_depth: int = None) -> (int, int, int):
+		"""
+		Search one ply deeper at a time until the time budget runs out
+
+		time_ms -- the wall-clock budget in milliseconds
+		max_depth -- the deepest iteration to run; defaults to filling the board
+
+		Returns a tuple of the best column, its score, and the depth of the last completed iteration
+		"""
+
+		position: Position = self.position
+		history_length: int = len(position.history)
+		deadline: float = time.monotonic() + time_ms / 1000
+		remaining: int = CELLS - position.moves
+		max_depth = remaining if max_depth is None else min(max_depth, remaining)
+
+		result: (int, int, int) = (-1, 0, 0)
+		for depth in range(1, max_depth + 1):
+
+			# Always finish the first iteration so there is a move to return
+			self.deadline = deadline if depth > 1 else None
+			try:
+				col, score = self.best_move(depth)
+			except SearchTimeout:
+				while len(position.history) > history_length:
+					position.undo()
+				break
+			result = (col, score, depth)
+
+			# Stop once the game is decided; deeper iterations cannot change the outcome
+			if abs(score) >= WIN_SCORE - CELLS or time.monotonic() > deadline:
+				break
+
+		self.deadline = None
+		return result
+
+
+class Solver:
+	"""Exact solver using null-window negamax searches over raw bitboards"""
+
+	# An optional object with an is_set() method, checked with the deadline; a solve times out early once it is set
+	stop: any = None
+
+	def __init__(self, table: SolverTable = None):
+		"""
+		Set up a solver; reuse it across moves, since solved entries never go stale
+
+		table -- an optional transposition table to share between solvers
+		"""
+
+		self.table: SolverTable = table if table is not None else SolverTable()
+		self.nodes: int = 0
+		self.deadline: float = None
+
+	def negamax(self, current: int, mask: int, moves: int, alpha: int, beta: int) -> int:
+		"""
+		Recursive negamax with alpha beta pruning over raw bitboards
+		The player to move must not be able to win immediately
+
+		current -- the token mask of the player to move
+		mask -- the mask of every token on the board
+		moves -- the number of tokens on the board
+		alpha -- lower bound of the search window
+		beta -- upper bound of the search window
+
+		Returns the score for the player to move: positive for a win, negative for a loss and 0 for a draw,
+		further from 0 the fewer moves the winner needs
+		"""
+
+		self.nodes += 1
+		if self.deadline is not None and not self.nodes & 1023 and (time.monotonic() > self.deadline or self.stop is not None and self.stop.is_set()):
+			raise SearchTimeout()
+
+		# Only keep moves that do not let the opponent win next turn; two open threats lose outright
+		possible: int = (mask + BOTTOM_MASK) & BOARD_MASK
+		opponent_wins: int = winning_cells(current ^ mask, mask)
+		forced: int = possible & opponent_wins
+		if forced:
+			if forced & (forced - 1):
+				return -((CELLS - moves) // 2)
+			possible = forced
+		possible &= ~(opponent_wins >> 1)
+		if not possible:
+			return -((CELLS - moves) // 2)
+		if moves >= CELLS - 2:
+			return 0
+
+		# Narrow the window to the scores still reachable from here
+		lowest: int = -((CELLS - 2 - moves) // 2)
+		if alpha < lowest:
+			alpha = lowest
+			if alpha >= beta:
+				return alpha
+		highest: int = (CELLS - 1 - moves) // 2
+		key: int = current + mask
+		mirror_key: int = mirror(key)
+		mirrored: bool = mirror_key < key
+		if mirrored:
+			key = mirror_key
+		entry: tuple = self.table.get(key)
+		if entry is not None:
+			if entry[1] == Bound.LOWER:
+				if alpha < entry[2]:
+					alpha = entry[2]
+					if alpha >= beta:
+						return alpha
+			elif highest > entry[2]:
+				highest = entry[2]
+		if beta > highest:
+			beta = highest
+			if alpha >= beta:
+				return beta
+
+		# Try the moves that create the most new threats first, center first on ties
+		order: [tuple] = []
+		for col in CENTER_ORDER:
+			move: int = possible & COLUMN_MASKS[col]
+			if move:
+				order.append((bin(winning_cells(current | move, mask)).count("1"), col, move))
+		order.sort(key=lambda item: item[0], reverse=True)
+
+		for threats, col, move in order:
+			score: int = -self.negamax(current ^ mask, mask | move, moves + 1, -beta, -alpha)
+			if score >= beta:
+				self.table.put(key, CELLS - moves, Bound.LOWER, score, MAX_COLS - 1 - col if mirrored else col)
+				return score
+			if score > alpha:
+				alpha = score
+		self.table.put(key, CELLS - moves, Bound.UPPER, alpha, -1)
+		return alpha
+
+	def score(self, current: int, mask: int, moves: int) -> int:
+		"""
+		Find the exact score of a position by narrowing null-window searches
+
+		current -- the token mask of the player to move
+		mask -- the mask of every token on the board
+		moves -- the number of tokens on the board
+		"""
+
+		if winning_cells(current, mask) & (mask + BOTTOM_MASK):
+			return (CELLS + 1 - moves) // 2
+
+		lowest: int = -((CELLS - moves) // 2)
+		highest: int = (CELLS + 1 - moves) // 2
+		while lowest < highest:
+
+			# Probe near 0 first, since most positions are close to a draw
+			middle: int = lowest + (highest - lowest) // 2
+			if middle <= 0 and -(-lowest // 2) < middle:
+				middle = -(-lowest // 2)
+			elif middle >= 0 and highest // 2 > middle:
+				middle = highest // 2
+
+			if self.negamax(current, mask, moves, middle, middle + 1) <= middle:
+				highest = middle
+			else:
+				lowest = middle + 1
+		return lowest
+
+	def column_score(self, current: int, mask: int, moves: int, col: int) -> int:
+		"""
+		Find the exact score of dropping a token into a playable column
+
+		current -- the token mask of the player to move
+		mask -- the mask of every token on the board
+		moves -- the number of tokens on the board
+		col -- the column to play
+		"""
+
+		move: int = (mask + BOTTOM_MASK) & COLUMN_MASKS[col]
+		if winning_cells(current, mask) & move:
+			return (CELLS + 1 - moves) // 2
+		return -self.score(current ^ mask, mask | move, moves + 1)
+
+	def analyze(self, position: Position) -> [int]:
+		"""
+		Score every column of a position
+
+		position -- the position to analyze
+
+		Returns the score of each column for the player to move, or None where the column is full
+		"""
+
+		current: int = position.bitboards[position.turn]
+		mask: int = position.mask()
+		scores: [int] = [None] * MAX_COLS
+		for col in CENTER_ORDER:
+			if position.can_play(col):
+				scores[col] = self.column_score(current, mask, position.moves, col)
+		return scores
+
+	def solve(self, position: Position, time_ms: int = None) -> Solution:
+		"""
+		Solve a position for the player to move
+
+		position -- the position to solve
+		time_ms -- an optional time budget in milliseconds; SearchTimeout is raised once it runs out
+		"""
+
+		current: int = position.bitboards[position.turn]
+		mask: int = position.mask()
+		columns: [int] = [col for col in CENTER_ORDER if position.can_play(col)]
+		if not columns:
+			return Solution(value=0, score=0, move=-1, distance=0)
+
+		# Solve the position, then take the first column whose reply keeps that score with a null-window test
+		self.deadline = None if time_ms is None else time.monotonic() + time_ms / 1000
+		try:
+			score: int = self.score(current, mask, position.moves)
+			best_move: int = columns[0]
+			for col in columns:
+				move: int = (mask + BOTTOM_MASK) & COLUMN_MASKS[col]
+				if winning_cells(current, mask) & move:
+					best_move = col
+					break
+				reply_current: int = current ^ mask
+				reply_mask: int = mask | move
+				if winning_cells(reply_current, reply_mask) & (reply_mask + BOTTOM_MASK):
+					continue
+				if self.negamax(reply_current, reply_mask, position.moves + 1, -score, -score + 1) <= -score:
+					best_move = col
+					break
+		finally:
+			self.deadline = None
+
+		# Recover how many plies remain until the last move of the game from the score
+		if score == 0:
+			distance: int = CELLS - position.moves
 		else:
-			break
-
-	# Determine best move
-	a_b_pruning(move_tree[0])
-	minimum = -99999
-	best: Node = Node()
-	for child in move_tree[0].children:
-		if child.beta >= minimum:
-			minimum = child.beta
-			best = child
-
-	for i in range(c4gui.MAX_COLS):
-		for j in range(c4gui.MAX_ROWS):
-			if not best.board_state[j][i] == board[j][i]:
-				board[j][i] = letter
+			tokens_before_win: int = CELLS + 1 - 2 * abs(score)
+			if (tokens_before_win - position.moves) % 2 != (0 if score > 0 else 1):
+				tokens_before_win -= 1
+			distance: int = tokens_before_win - position.moves + 1
+		return Solution(value=(score > 0) - (score < 0), score=score, move=best_move, distance=distance)
+
+
+def cpu_algorithm_hard(board: [[]], letter: chr, depth: int, time_ms: int = None, cache: any = None, observer: callable = None) -> (int, int):
+	"""
+	Hard Algorithm for CPU player
+
+	letter -- character to place
+	depth -- search depth for how many future moves to calculate
+	time_ms -- an optional time budget in milliseconds; the search then deepens iteratively up to depth
+	cache -- an optional c4cache.PersistentCache; a stored result stands in for the search when it is at least as deep,
+	or for any time-budgeted search, whose depth varies with machine load anyway
+	observer -- an optional function called with the SearchStats after every completed iteration; a move from the cache has none
+
+	Returns the row and column of the placed token
+	"""
+
+	if check_if_board_full(board) or check_win(board):
+		raise ValueError("no move to make on a finished board")
+
+	position: Position = Position.from_board(board, letter)
+	if cache is not None:
+		entry: tuple = cache.get(position)
+		if entry is not None and entry[3] >= 0 and (time_ms is not None or entry[0] >= min(depth, CELLS - position.moves)):
+			return drop_token(board, entry[3], letter), entry[3]
+
+	search: Search = Search(position, observer=observer)
+	if time_ms is None:
+		col, score = search.best_move(depth)
+	else:
+		col, score, depth = search.iterative_deepening(time_ms, depth)
+	if cache is not None:
+		cache.put(position, depth, Bound.EXACT, score, col)
+	return drop_token(board, col, letter), col
+
+
+def shared_solver() -> Solver:
+	"""Get the solver kept for the whole program, allocating its table on first use"""
+
+	global _solver
+	if _solver is None:
+		_solver = Solver()
+	return _solver
+
+
+_solver: Solver = None
+
+
+def cpu_algorithm_perfect(board: [[]], letter: chr, time_ms: int = None, cache: any = None) -> (int, int):
+	"""
+	Perfect Algorithm for CPU player (plays the solved best move)
+
+	letter -- character to place
+	time_ms -- an optional time budget in milliseconds; solving may use half of it, and if it runs out the hard algorithm moves with the time left
+	cache -- an optional c4cache.PersistentCache; solved positions are stored as searches to the end of the game
+
+	Returns the row and column of the placed token
+	"""
+
+	position: Position = Position.from_board(board, letter)
+	remaining: int = CELLS - position.moves
+	if cache is not None:
+		entry: tuple = cache.get(position)
+		if entry is not None and entry[3] >= 0 and entry[0] >= remaining:
+			return drop_token(board, entry[3], letter), entry[3]
+
+	start: float = time.monotonic()
+	try:
+		solution: Solution = shared_solver().solve(position, None if time_ms is None else time_ms // 2)
+	except SearchTimeout:
+		elapsed: int = int((time.monotonic() - start) * 1000)
+		return cpu_algorithm_hard(board, letter, CELLS, max(time_ms - elapsed, 1), cache)
+
+	# The game ends distance plies from now, which is when the search scale counts a win from
+	if cache is not None and solution.move >= 0:
+		cache.put(position, remaining, Bound.EXACT, solution.value * (WIN_SCORE - position.moves - solution.distance), solution.move)
+	return drop_token(board, solution.move, letter), solution.move
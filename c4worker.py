@@ -0,0 +1,225 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+import c4book
+import c4cache
+import c4mcts
+import c4parallel
+import c4utils
+import multiprocessing
+import pygame
+
+from concurrent.futures import Future, ProcessPoolExecutor
+
+# Opening books already mapped by this process, by file path
+_books: dict = {}
+
+# Persistent caches already opened by this process, by file path
+_caches: dict = {}
+
+# Parallel searches already started by this process, by worker count
+_searches: dict = {}
+
+# Monte Carlo trees kept between moves, by the letter they play
+_trees: dict = {}
+
+# Moves found while pondering, by the arguments choose_move would be called with
+_pondered: dict = {}
+
+# The request counter shared with the worker's parent; pondering stops once it changes
+_generation: multiprocessing.Value = None
+
+
+def initialize(generation: multiprocessing.Value) -> None:
+	"""
+	Set up a worker process
+
+	generation -- the parent's request counter
+	"""
+
+	global _generation
+	_generation = generation
+
+
+class Interrupt:
+	"""Looks like a set event once the parent has made a new request"""
+
+	def __init__(self, generation: int):
+		"""
+		Remember the request the work belongs to
+
+		generation -- the request counter value when the work was started
+		"""
+
+		self.generation: int = generation
+
+	def is_set(self) -> bool:
+		"""Determine if a newer request has been made"""
+
+		return _generation is not None and _generation.value != self.generation
+
+
+def choose_move(board: [[]], letter: chr, difficulty: int, time_ms: int, solver_discs: int, book_file: str, workers: int = 1, engine: str = "alphabeta", cache_file: str = "") -> int:
+	"""
+	Pick a CPU move for a board; runs inside the worker process
+
+	board -- the 2D game board
+	letter -- character to place
+	difficulty -- the CPU difficulty; below 3 plays randomly, 9 and up solves late positions
+	time_ms -- the search budget in milliseconds
+	solver_discs -- the token count after which difficulties 9 and up use the solver
+	book_file -- the opening book to look up first, which may not exist
+	workers -- the number of processes the hard search splits its root moves across
+	engine -- "alphabeta" for the hard search and solver, or "mcts" for Monte Carlo tree search
+	cache_file -- a persistent cache for serial hard searches and the solver to share between games, or "" for none
+
+	Returns the chosen column
+	"""
+
+	key: tuple = (tuple(map(tuple, board)), letter, difficulty, time_ms, solver_discs, book_file, workers, engine, cache_file)
+	if key in _pondered:
+		return _pondered[key]
+
+	# The CPU algorithms place their token, so leave the caller's board untouched
+	board = [row[:] for row in board]
+	if difficulty < 3:
+		return c4utils.cpu_algorithm_easy(board, letter)[1]
+
+	if book_file not in _books:
+		_books[book_file] = c4book.open_book(book_file)
+	if _books[book_file] is not None:
+		entry: (int, int) = _books[book_file].lookup(c4utils.Position.from_board(board, letter))
+		if entry is not None:
+			return entry[0]
+
+	if engine == "mcts":
+		if letter not in _trees:
+			_trees[letter] = c4mcts.MCTS()
+		return c4mcts.cpu_algorithm_mcts(board, letter, time_ms, tree=_trees[letter])[1]
+
+	if cache_file and cache_file not in _caches:
+		_caches[cache_file] = c4cache.PersistentCache(cache_file)
+	cache: c4cache.PersistentCache = _caches.get(cache_file)
+	tokens: int = sum(cell != " " for row in board for cell in row)
+	if difficulty >= 9 and tokens >= solver_discs:
+		return c4utils.cpu_algorithm_perfect(board, letter, time_ms, cache)[1]
+	if workers > 1:
+		if workers not in _searches:
+			_searches[workers] = c4parallel.ParallelSearch(workers)
+		return _searches[workers].iterative_deepening(c4utils.Position.from_board(board, letter), time_ms)[0]
+	return c4utils.cpu_algorithm_hard(board, letter, c4utils.CELLS, time_ms, cache)[1]
+
+
+def flush_caches() -> None:
+	"""Append every pending cache result to its log; runs inside the worker process before it stops"""
+
+	for cache in _caches.values():
+		cache.flush()
+
+
+def ponder(board: [[]], letter: chr, difficulty: int, time_ms: int, solver_discs: int, book_file: str, workers: int, engine: str, cache_file: str, generation: int) -> None:
+	"""
+	Search the replies to a CPU move on the opponent's time; runs inside the worker process until a new request arrives
+
+	Each reply's move is kept for choose_move, or with Monte Carlo tree search the CPU's tree grows under every reply
+
+	board -- the 2D game board after the CPU move
+	letter -- the CPU's character
+	generation -- the request counter value when pondering was started
+	The other arguments are the same as for choose_move
+	"""
+
+	interrupt: Interrupt = Interrupt(generation)
+	c4utils.Search.stop = c4utils.Solver.stop = c4mcts.MCTS.stop = interrupt
+	_pondered.clear()
+	try:
+		if engine == "mcts":
+			if letter not in _trees:
+				_trees[letter] = c4mcts.MCTS()
+			_trees[letter].search(c4utils.Position.from_board(board, "O" if letter == "X" else "X"), time_ms * c4utils.MAX_COLS)
+			return
+
+		for col in c4utils.CENTER_ORDER:
+			if interrupt.is_set():
+				return
+			if c4utils.check_if_column_full(board, col):
+				continue
+			reply: [[]] = [row[:] for row in board]
+			row: int = c4utils.drop_token(reply, col, "O" if letter == "X" else "X")
+			if c4utils.check_win_at(reply, row, col) or c4utils.check_if_board_full(reply):
+				continue
+			move: int = choose_move(reply, letter, difficulty, time_ms, solver_discs, book_file, workers, engine, cache_file)
+
+			# A search cut short by the interrupt may not have found the best move
+			if interrupt.is_set():
+				return
+			_pondered[(tuple(map(tuple, reply)), letter, difficulty, time_ms, solver_discs, book_file, workers, engine, cache_file)] = move
+	finally:
+		c4utils.Search.stop = c4utils.Solver.stop = c4mcts.MCTS.stop = None
+
+
+class Worker:
+	"""Runs CPU searches in a separate process and posts each result as a pygame event"""
+
+	def __init__(self):
+		"""Set up the worker; its process starts with the first request"""
+
+		self.executor: ProcessPoolExecutor = None
+		self.pending: Future = None
+		self.generation: multiprocessing.Value = multiprocessing.Value("i", 0)
+
+	def busy(self) -> bool:
+		"""Determine if a search is still running"""
+
+		return self.pending is not None and not self.pending.done()
+
+	def request(self, board: [[]], letter: chr, difficulty: int, time_ms: int, solver_discs: int, book_file: str, workers: int = 1, engine: str = "alphabeta", cache_file: str = "", ponder: bool = False) -> None:
+		"""
+		Start searching for a move; a USEREVENT with user_type CPU_MOVE and the column follows once it is found
+
+		Any pondering still running stops at once.
+		ponder -- keep searching the opponent's replies after the move; parallel searches do not ponder
+		The other arguments are the same as for choose_move
+		"""
+
+		if self.executor is None:
+			self.executor = ProcessPoolExecutor(max_workers=1, initializer=initialize, initargs=(self.generation,))
+		with self.generation.get_lock():
+			self.generation.value += 1
+		args: tuple = (board, letter, difficulty, time_ms, solver_discs, book_file, workers, engine, cache_file)
+		self.pending = self.executor.submit(choose_move, *args)
+		self.pending.add_done_callback(lambda future: self.post(future, args if ponder and workers == 1 and difficulty >= 3 else None))
+
+	def post(self, future: Future, ponder_args: tuple = None) -> None:
+		"""
+		Post a finished search to the pygame queue, then start pondering; runs on the executor's thread
+
+		future -- the finished search
+		ponder_args -- the choose_move arguments of the search, if its replies should be pondered
+		"""
+
+		if future.cancelled():
+			return
+		if future.exception() is not None:
+			pygame.event.post(pygame.event.Event(pygame.USEREVENT, {"user_type": "CPU_MOVE", "column": -1, "error": future.exception()}))
+			return
+
+		# Read the counter first, so pondering never outlives a request made while the event is handled
+		generation: int = self.generation.value
+		pygame.event.post(pygame.event.Event(pygame.USEREVENT, {"user_type": "CPU_MOVE", "column": future.result(), "error": None}))
+		if ponder_args is not None:
+			board: [[]] = [row[:] for row in ponder_args[0]]
+			row: int = c4utils.drop_token(board, future.result(), ponder_args[1])
+			if self.executor is not None and not c4utils.check_win_at(board, row, future.result()) and not c4utils.check_if_board_full(board):
+				self.executor.submit(ponder, board, *ponder_args[1:], generation)
+
+	def shutdown(self) -> None:
+		"""Stop the worker process, waiting for any running search and writing its cache results"""
+
+		with self.generation.get_lock():
+			self.generation.value += 1
+		if self.executor is not None:
+			self.executor.submit(flush_caches)
+			self.executor.shutdown()
+			self.executor = None
+		self.pending = None
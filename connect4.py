@@ -3,6 +3,8 @@
 
 import c4gui
 import c4utils
+import c4worker
+import os
 import pygame
 import network
 
@@ -13,6 +15,9 @@ WIDTH: int = int(screen.current_w / c4gui.SCALE_MODIFIER)
 DISPLAY: pygame.display = pygame.display.set_mode((WIDTH, HEIGHT), pygame.NOFRAME)
 CLOCK: pygame.time.Clock = pygame.time.Clock()
 
+# CPU players search in a worker process so the game keeps rendering while they think
+WORKER: c4worker.Worker = c4worker.Worker()
+
 
 def screen_menu(start_at: int = c4gui.menu.SubMenu.MAIN) -> None:
     """
@@ -26,15 +31,21 @@ def screen_menu(start_at: int = c4gui.menu.SubMenu.MAIN) -> None:
     menu.render(DISPLAY, CLOCK)
 
 
-def move_end_event(from_game: c4gui.game.Game, board: [[]], p1turn: bool) -> None:
+def move_end_event(from_game: c4gui.game.Game, board: [[]], p1turn: bool, last_move: (int, int) = None) -> None:
     """
     Callback event for the end of each player's turn
     from_menu -- The menu used to trigger the callback
     board -- The board state
     p1turn -- True if it's player 1's turn; False if it's player 2's turn
+    last_move -- The row and column of the last placed token; the whole board is checked if omitted
     """
 
-    if c4utils.check_win(board):
+    if last_move is not None:
+        won: bool = c4utils.check_win_at(board, last_move[0], last_move[1])
+    else:
+        won: bool = c4utils.check_win(board)
+
+    if won:
         from_game.set_winner(c4gui.game.Winner.P1 if p1turn else c4gui.game.Winner.P2)
 
     if c4utils.check_if_board_full(board):
@@ -62,21 +73,18 @@ def player_event(from_game: c4gui.game.Game, p1turn: bool, column: int) -> bool:
         return False
 
     # Update the board
-    for i in range(c4gui.MAX_ROWS-1, -1, -1):
-        if board[i][column] == " ":
-            board[i][column] = "X" if p1turn else "O"
-            break
+    row: int = c4utils.drop_token(board, column, "X" if p1turn else "O")
     from_game.update_board(board)
 
     # Check for an end condition
-    move_end_event(from_game, board, p1turn)
+    move_end_event(from_game, board, p1turn, (row, column))
 
     return True
 
 
 def computer_event(from_game: c4gui.game.Game, p1turn: bool) -> None:
     """
-    Callback to handle a computer's move
+    Callback to start a computer's move; the column arrives later as a CPU_MOVE user event
 
     from_menu -- The menu used to trigger the callback
     p1turn -- True if it's player 1's turn; False if it's player 2's turn
@@ -91,18 +99,14 @@ def computer_event(from_game: c4gui.game.Game, p1turn: bool) -> None:
         raise ValueError("computer event is invalid for game type")
 
     difficulty: int = c4gui.config.get(section, "difficulty", int)
-    turn_num: int = len(from_game.boards)
-
-    if difficulty < 3:
-        c4utils.cpu_algorithm_easy(board, "X" if p1turn else "O")
-    elif difficulty < 6:
-        c4utils.cpu_algorithm_hard(board, "X" if p1turn else "O", 2)
-    elif difficulty < 9 or turn_num < 18:
-        c4utils.cpu_algorithm_hard(board, "X" if p1turn else "O", 4)
-    else:
-        c4utils.cpu_algorithm_hard(board, "X" if p1turn else "O", 6)
-    from_game.update_board(board)
-    move_end_event(from_game, board, p1turn)
+    time_budgets: tuple = c4gui.config.get("Engine", "time_budgets", tuple)
+    cache_file: str = c4gui.config.get("Engine", "cache_file", str)
+    WORKER.request(board, "X" if p1turn else "O", difficulty, time_budgets[difficulty - 1],
+                   c4gui.config.get("Engine", "solver_discs", int),
+                   os.path.join(c4gui.ORIGIN_PATH, c4gui.config.get("Engine", "book_file", str)),
+                   c4gui.config.get("Engine", "search_workers", int), c4gui.config.get(section, "engine", str),
+                   os.path.join(c4gui.ORIGIN_PATH, cache_file) if cache_file else "",
+                   from_game.game_type == c4gui.game.GameType.SINGLE and c4gui.config.get("Engine", "ponder", bool))
 
 
 def screen_game(from_menu: c4gui.menu, game_type: int, net: network.Network = None) -> None:
@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+import c4batch
+import c4utils
+
+def test_should_match_evaluate_board_and_check_win_in_batch() -> None:
+    boards = [[[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", "O", "O", " ", " ", " "],
+	["X", "X", "X", "X", "O", " ", " "]],
+	[[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", "X", " ", " ", " ", " "],
+	[" ", " ", "O", "O", " ", " ", " "],
+	[" ", "X", "X", "O", "X", " ", " "]]]
+    scores, wins = c4batch.evaluate_batch(c4batch.boards_to_array(boards))
+    for i in range(len(boards)):
+        assert c4utils.evaluate_board(boards[i], "X") == scores[i]
+        assert c4utils.check_win(boards[i]) == wins[i]
+
+
+def test_should_convert_positions_like_boards() -> None:
+    position = c4utils.Position()
+    for col in [2, 3, 1, 3, 4, 2, 2]:
+        position.play(col)
+    assert (c4batch.boards_to_array([position.to_board()]) == c4batch.positions_to_array([position])).all()
+
+
+def test_should_take_winning_move_with_frontier_search() -> None:
+    board = [[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", "O", "O", " ", " ", " "],
+	[" ", "X", "X", "X", "O", " ", " "]]
+    col, score = c4batch.search_frontier(c4utils.Position.from_board(board, "X"), 3)
+    assert 0 == col
+    assert score > c4utils.WIN_SCORE - c4utils.CELLS
+
+
+def test_should_handle_empty_batch_and_finished_root() -> None:
+    scores, wins = c4batch.evaluate_batch(c4batch.boards_to_array([]))
+    assert 0 == len(scores) == len(wins)
+    position = c4utils.Position()
+    assert (-1, 0) == c4batch.search_frontier(position, 0)
+    for col in [0, 1, 0, 1, 0, 1, 0]:
+        position.play(col)
+    col, score = c4batch.search_frontier(position, 3)
+    assert -1 == col
+    assert score < 0
+
+
+if __name__ == "__main__":
+    test_should_match_evaluate_board_and_check_win_in_batch()
+    test_should_convert_positions_like_boards()
+    test_should_take_winning_move_with_frontier_search()
+    test_should_handle_empty_batch_and_finished_root()
+    print("PASS, 0 failures")
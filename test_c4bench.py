@@ -0,0 +1,33 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+import c4bench
+import c4utils
+import json
+
+def test_should_use_positions_that_are_still_open() -> None:
+    for moves in c4bench.POSITIONS.values():
+        board, letter = c4bench.board_from_moves(moves)
+        assert not c4utils.check_win(board)
+        assert not c4utils.check_if_board_full(board)
+        assert letter == c4utils.LETTERS[len(moves) % 2]
+        position = c4utils.Position.from_board(board, letter)
+        assert not c4utils.winning_cells(position.bitboards[position.turn], position.mask()) & (position.mask() + c4utils.BOTTOM_MASK) & c4utils.BOARD_MASK
+
+
+def test_should_report_every_benchmark_as_json() -> None:
+    results = json.loads(json.dumps(c4bench.run(2)))
+    assert c4bench.POSITIONS_VERSION == results["positions_version"]
+    searches = [result for result in results["results"] if result["benchmark"] == "cpu_algorithm_hard"]
+    assert 2 * len(c4bench.POSITIONS) == len(searches)
+    for result in searches:
+        assert result["nodes"] > 0 and result["nps"] > 0 and result["peak_bytes"] > 0
+        assert result["column"] in range(c4utils.MAX_COLS)
+    assert 2 * len(c4bench.POSITIONS) == len(results["results"]) - len(searches)
+    assert len(results["results"]) + 1 == len(c4bench.report(results).splitlines())
+
+
+if __name__ == "__main__":
+    test_should_use_positions_that_are_still_open()
+    test_should_report_every_benchmark_as_json()
+    print("PASS, 0 failures")
@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+import c4book
+import c4utils
+import os
+import tempfile
+
+def test_should_build_sorted_book_and_look_up_positions() -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "book.bin")
+        assert 5 == c4book.build_book(path, 1, 1)
+        book = c4book.open_book(path)
+        assert 5 == len(book)
+        assert [book[i] for i in range(len(book))] == sorted(book[i] for i in range(len(book)))
+
+        position = c4utils.Position()
+        col, score = book.lookup(position)
+        assert col in range(c4utils.MAX_COLS)
+        position.play(3)
+        assert book.lookup(position) is not None
+        position.play(3)
+        assert book.lookup(position) is None
+        book.close()
+
+
+def test_should_store_solved_moves_in_book() -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "book.bin")
+        with open(path, "wb") as fp:
+            pass
+        assert 0 == len(c4book.open_book(path))
+        assert c4book.open_book(os.path.join(folder, "missing.bin")) is None
+
+        position = c4utils.Position()
+        for col in [0, 0, 0, 6, 2, 4, 4, 6, 6, 5, 3, 2, 0, 2, 5, 1, 0, 0]:
+            position.play(col)
+        solution = c4utils.shared_solver().solve(position)
+        key, mirrored = position.canonical_key()
+        with open(path, "wb") as fp:
+            fp.write(c4book.RECORD.pack(key, 1 if mirrored else 5, solution.score))
+        book = c4book.open_book(path)
+        assert (5, solution.score) == book.lookup(position)
+
+        # The mirror image shares the record, with the column mirrored back
+        reflected = c4utils.Position()
+        for col in [0, 0, 0, 6, 2, 4, 4, 6, 6, 5, 3, 2, 0, 2, 5, 1, 0, 0]:
+            reflected.play(c4utils.MAX_COLS - 1 - col)
+        assert (1, solution.score) == book.lookup(reflected)
+        book.close()
+
+
+if __name__ == "__main__":
+    test_should_build_sorted_book_and_look_up_positions()
+    test_should_store_solved_moves_in_book()
+    print("PASS, 0 failures")
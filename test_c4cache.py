@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+import c4cache
+import c4utils
+import os
+import tempfile
+
+BOARD = [["O", " ", " ", " ", " ", " ", " "],
+	["X", " ", " ", " ", " ", " ", " "],
+	["X", " ", " ", " ", " ", " ", " "],
+	["X", " ", "O", " ", " ", " ", "X"],
+	["O", " ", "O", " ", "X", "X", "O"],
+	["X", "O", "X", "X", "O", "O", "O"]]
+
+def test_should_share_results_between_processes_and_mirror_images() -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "cache.bin")
+        writer = c4cache.PersistentCache(path, batch=2)
+        reader = c4cache.PersistentCache(path)
+        position = c4utils.Position()
+        for col in [0, 1, 1]:
+            position.play(col)
+        assert reader.get(position) is None
+
+        # Results stay in memory until a batch is full
+        writer.put(position, 6, c4utils.Bound.EXACT, -25, 2)
+        assert (6, c4utils.Bound.EXACT, -25, 2) == writer.get(position)
+        assert reader.get(position) is None
+        position.play(2)
+        writer.put(position, 5, c4utils.Bound.LOWER, 40, 6)
+        position.undo()
+        assert (6, c4utils.Bound.EXACT, -25, 2) == reader.get(position)
+
+        # Shallower results never replace deeper ones
+        writer.put(position, 3, c4utils.Bound.EXACT, 10, 3)
+        assert (6, c4utils.Bound.EXACT, -25, 2) == writer.get(position)
+
+        reflected = c4utils.Position()
+        for col in [6, 5, 5]:
+            reflected.play(col)
+        assert (6, c4utils.Bound.EXACT, -25, 4) == reader.get(reflected)
+        writer.close()
+        reader.close()
+
+
+def test_should_keep_results_through_compaction() -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "cache.bin")
+        cache = c4cache.PersistentCache(path, batch=1)
+        position = c4utils.Position()
+        for col in range(c4utils.MAX_COLS):
+            position.play(col)
+            cache.put(position, col + 1, c4utils.Bound.UPPER, col - 3, col)
+        reader = c4cache.PersistentCache(path)
+        assert reader.get(position) is not None
+
+        assert c4utils.MAX_COLS == cache.compact()
+        assert sorted(os.listdir(folder)) == ["cache.bin"]
+        for col in range(c4utils.MAX_COLS - 1, -1, -1):
+            assert (col + 1, c4utils.Bound.UPPER, col - 3, col) == c4cache.PersistentCache(path).get(position)
+            assert (col + 1, c4utils.Bound.UPPER, col - 3, col) == reader.get(position)
+            position.undo()
+        cache.close()
+        reader.close()
+
+
+def test_should_answer_searches_from_cache() -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        cache = c4cache.PersistentCache(os.path.join(folder, "cache.bin"))
+        board = [row[:] for row in BOARD]
+        assert 5 == c4utils.cpu_algorithm_hard(board, "X", 4, cache=cache)[1]
+        assert (4, c4utils.Bound.EXACT) == cache.get(c4utils.Position.from_board(BOARD, "X"))[:2]
+
+        # A stored result at least as deep is played without searching, even a worse one
+        cache.put(c4utils.Position.from_board(BOARD, "X"), 6, c4utils.Bound.EXACT, 0, 3)
+        assert 3 == c4utils.cpu_algorithm_hard([row[:] for row in BOARD], "X", 6, cache=cache)[1]
+        assert 3 == c4utils.cpu_algorithm_hard([row[:] for row in BOARD], "X", c4utils.CELLS, 50, cache)[1]
+        assert 5 == c4utils.cpu_algorithm_hard([row[:] for row in BOARD], "X", 8, cache=cache)[1]
+
+        # Solved positions count as searched to the end of the game
+        assert 5 == c4utils.cpu_algorithm_perfect([row[:] for row in BOARD], "X", cache=cache)[1]
+        depth, bound, value, move = cache.get(c4utils.Position.from_board(BOARD, "X"))
+        assert (c4utils.CELLS - 18, c4utils.Bound.EXACT, 5) == (depth, bound, move)
+        assert value == c4utils.WIN_SCORE - 18 - c4utils.shared_solver().solve(c4utils.Position.from_board(BOARD, "X")).distance
+        cache.close()
+
+
+if __name__ == "__main__":
+    test_should_share_results_between_processes_and_mirror_images()
+    test_should_keep_results_through_compaction()
+    test_should_answer_searches_from_cache()
+    print("PASS, 0 failures")
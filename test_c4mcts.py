@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+import c4mcts
+import c4utils
+
+def test_should_take_winning_move_with_mcts() -> None:
+    board = [[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", "O", "O", " ", " ", " "],
+	[" ", "X", "X", "X", "O", " ", " "]]
+    assert (5, 0) == c4mcts.cpu_algorithm_mcts(board, "X", playouts=100)
+
+
+def test_should_block_opponent_with_mcts() -> None:
+    board = [[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", "O", "O", "O", "X", "X", "X"]]
+    tree = c4mcts.MCTS(seed=4)
+    assert (5, 0) == c4mcts.cpu_algorithm_mcts(board, "X", playouts=3000, tree=tree)
+    assert tree.playouts <= 3000
+
+
+def test_should_reuse_tree_between_moves() -> None:
+    tree = c4mcts.MCTS(seed=2)
+    position = c4utils.Position()
+    col = tree.search(position, playouts=500)
+    nodes = len(tree.moves)
+    position.play(col)
+    position.play(3)
+    tree.search(position, playouts=10)
+    assert 0 != tree.root
+    assert tree.visits[tree.root] > 10
+    assert nodes < len(tree.moves)
+
+    position.undo()
+    position.undo()
+    position.play(0 if col else 1)
+    tree.search(position, playouts=10)
+    assert 0 == tree.root
+
+
+if __name__ == "__main__":
+    test_should_take_winning_move_with_mcts()
+    test_should_block_opponent_with_mcts()
+    test_should_reuse_tree_between_moves()
+    print("PASS, 0 failures")
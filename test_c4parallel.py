@@ -0,0 +1,40 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+import c4parallel
+import c4utils
+
+BOARD = [[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", "X", " ", " ", " ", " "],
+	[" ", " ", "O", "O", " ", " ", " "],
+	[" ", "X", "X", "O", "X", " ", " "]]
+
+def test_should_match_serial_search_with_one_worker() -> None:
+    serial = c4utils.Search(c4utils.Position.from_board(BOARD)).best_move(5)
+    search = c4parallel.ParallelSearch(1)
+    assert serial == search.best_move(c4utils.Position.from_board(BOARD), 5)
+    assert serial == search.best_move(c4utils.Position.from_board(BOARD), 5)
+    assert search.executor is None
+
+
+def test_should_keep_serial_score_when_splitting_root() -> None:
+    search = c4parallel.ParallelSearch(2)
+    try:
+        col, score = search.best_move(c4utils.Position.from_board(BOARD), 5)
+        assert c4utils.Search(c4utils.Position.from_board(BOARD)).best_move(5)[1] == score
+        position = c4utils.Position.from_board(BOARD)
+        position.play(col)
+        assert -score == c4utils.Search(position).negamax(4, -c4utils.WIN_SCORE - 1, c4utils.WIN_SCORE + 1)
+        col, score, depth = search.iterative_deepening(c4utils.Position.from_board(BOARD), 100, 4)
+        assert col in c4utils.CENTER_ORDER
+        assert 1 <= depth <= 4
+    finally:
+        search.shutdown()
+
+
+if __name__ == "__main__":
+    test_should_match_serial_search_with_one_worker()
+    test_should_keep_serial_score_when_splitting_root()
+    print("PASS, 0 failures")
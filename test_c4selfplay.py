@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+import c4selfplay
+import c4utils
+import io
+import json
+import math
+
+def test_should_parse_engine_configurations() -> None:
+    assert {"algorithm": "alphabeta", "depth": 6} == c4selfplay.parse_engine("alphabeta:depth=6")
+    assert {"algorithm": "mcts", "playouts": 200, "time": 50} == c4selfplay.parse_engine("mcts:playouts=200,time=50")
+    assert {"algorithm": "random"} == c4selfplay.parse_engine("random")
+    for spec in ("minimax", "alphabeta", "random:depth=2", "perfect:playouts=5"):
+        try:
+            c4selfplay.parse_engine(spec)
+            assert False, spec
+        except ValueError:
+            pass
+
+
+def test_should_estimate_elo_with_confidence_interval() -> None:
+    assert (0.0, 0.0, 0.0) == c4selfplay.elo(0, 10, 0)
+    difference, low, high = c4selfplay.elo(60, 20, 20)
+    assert 147 == round(difference)
+    assert low < difference < high
+    assert math.inf == c4selfplay.elo(5, 0, 0)[0]
+    assert round(c4selfplay.elo(6, 0, 4)[0]) == -round(c4selfplay.elo(4, 0, 6)[0])
+
+
+def test_should_pick_open_random_openings() -> None:
+    assert c4selfplay.random_opening(8, 3) == c4selfplay.random_opening(8, 3)
+    for seed in range(20):
+        opening = c4selfplay.random_opening(8, seed)
+        assert 8 == len(opening)
+        position = c4utils.Position()
+        for col in opening:
+            position.play(col)
+            assert not position.has_won(position.turn ^ 1)
+
+
+def test_should_stream_match_results() -> None:
+    output = io.StringIO()
+    engines = (c4selfplay.parse_engine("alphabeta:depth=4"), c4selfplay.parse_engine("random"))
+    summary = c4selfplay.run(4, engines, 2, 1, 5, output)
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [0, 1, 2, 3] == [record["game"] for record in records]
+    assert records[0]["opening"] == records[1]["opening"] != records[2]["opening"]
+    assert ["X", "O", "X", "O"] == [record["first_engine_letter"] for record in records]
+    assert 4 == summary["wins"] + summary["draws"] + summary["losses"]
+    assert summary["wins"] >= 3
+    for record in records:
+        board = [[" "] * c4utils.MAX_COLS for row in range(c4utils.MAX_ROWS)]
+        for ply, col in enumerate(record["moves"]):
+            assert c4utils.drop_token(board, col, c4utils.LETTERS[ply % 2]) >= 0
+        assert c4utils.check_win(board) == (record["result"] != 0.5)
+
+
+if __name__ == "__main__":
+    test_should_parse_engine_configurations()
+    test_should_estimate_elo_with_confidence_interval()
+    test_should_pick_open_random_openings()
+    test_should_stream_match_results()
+    print("PASS, 0 failures")
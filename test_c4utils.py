@@ -3,6 +3,10 @@
 
 import c4gui
 import c4utils
+import os
+import subprocess
+import sys
+import time
 
 def test_should_return_true_if_column_is_full() -> None:
     board = [["X", " ", " ", " ", " ", " ", " "],
@@ -75,6 +79,241 @@ def test_should_not_win_for_no_4_in_a_row() -> None:
 	[" ", "X", "X", "X", "O", " ", " "]]
     assert False == c4utils.check_win(board)
 
+def test_should_convert_board_to_position_and_back() -> None:
+    board = [[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", "O", "O", " ", " ", " "],
+	[" ", "X", "X", "X", "O", " ", " "]]
+    position = c4utils.Position.from_board(board)
+    assert 6 == position.moves
+    assert 0 == position.turn
+    assert board == position.to_board()
+
+
+def test_should_play_and_undo_moves_on_position() -> None:
+    position = c4utils.Position()
+    for col in [3, 3, 4, 4, 5, 5]:
+        position.play(col)
+    assert False == position.has_won(0)
+    position.play(6)
+    assert True == position.has_won(0)
+    assert 6 == position.undo()
+    assert False == position.has_won(0)
+    assert 6 == position.moves
+
+def test_should_take_winning_move_with_hard_algorithm() -> None:
+    board = [[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", "O", "O", "O", " ", " "],
+	[" ", "X", "X", "X", "O", " ", " "]]
+    c4utils.cpu_algorithm_hard(board, "X", 4)
+    assert "X" == board[5][0] or "X" == board[5][5]
+    assert True == c4utils.check_win(board)
+
+
+def test_should_block_opponent_with_hard_algorithm() -> None:
+    board = [[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	["X", "X", "X", " ", "O", "O", " "]]
+    c4utils.cpu_algorithm_hard(board, "O", 4)
+    assert "O" == board[5][3]
+
+def test_should_search_within_time_budget() -> None:
+    position = c4utils.Position()
+    search = c4utils.Search(position)
+    col, score, depth = search.iterative_deepening(50)
+    assert col in range(c4gui.MAX_COLS)
+    assert depth >= 1
+    assert col == search.pv[0]
+    assert [] == position.history
+
+def test_should_keep_score_and_search_fewer_nodes_with_move_ordering() -> None:
+    board = [[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", "X", " ", " ", " ", " "],
+	[" ", " ", "O", "O", " ", " ", " "],
+	[" ", "X", "X", "O", "X", " ", " "]]
+    plain = c4utils.Search(c4utils.Position.from_board(board, "O"), ordering=False)
+    ordered = c4utils.Search(c4utils.Position.from_board(board, "O"))
+    assert plain.best_move(6)[1] == ordered.best_move(6)[1]
+    assert ordered.nodes < plain.nodes
+
+def test_should_win_at_last_placed_token() -> None:
+    board = [[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", "O", " ", " ", " ", " ", " "],
+	[" ", "O", "O", " ", " ", " ", " "],
+	[" ", "X", "O", "O", " ", " ", " "],
+	[" ", "X", "X", "X", "O", "X", "X"]]
+    assert True == c4utils.check_win_at(board, 3, 2)
+    assert False == c4utils.check_win_at(board, 5, 5)
+    assert False == c4utils.check_win_at(board, 0, 0)
+
+
+def test_should_drop_token_to_lowest_free_row() -> None:
+    board = [["X", " ", " ", " ", " ", " ", " "],
+	["X", " ", " ", " ", " ", " ", " "],
+	["X", " ", " ", " ", " ", " ", " "],
+	["X", " ", " ", " ", " ", " ", " "],
+	["X", " ", "O", "O", " ", " ", " "],
+	["X", "X", "X", "X", "O", " ", " "]]
+    assert 3 == c4utils.drop_token(board, 2, "X")
+    assert "X" == board[3][2]
+    assert -1 == c4utils.drop_token(board, 0, "O")
+
+def test_should_keep_window_scores_incrementally() -> None:
+    board = [[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", "X", " ", " ", " ", " "],
+	[" ", " ", "O", "O", " ", " ", " "],
+	[" ", "X", "X", "O", "X", " ", " "]]
+    position = c4utils.Position()
+    for col in [2, 3, 1, 3, 4, 2, 2]:
+        position.play(col)
+    assert board == position.to_board()
+    assert c4utils.evaluate_board(board, "X") == position.evaluate(0)
+    assert c4utils.evaluate_board(board, "O") == -c4utils.evaluate_board(board, "X")
+    while position.history:
+        position.undo()
+    assert 0 == position.score
+
+def test_should_solve_immediate_win() -> None:
+    board = [[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", "O", "O", " ", " ", " "],
+	[" ", "X", "X", "X", "O", " ", " "]]
+    solution = c4utils.Solver().solve(c4utils.Position.from_board(board))
+    assert 1 == solution.value
+    assert 0 == solution.move
+    assert 1 == solution.distance
+
+
+def test_should_solve_forced_loss_against_double_threat() -> None:
+    board = [[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", "O", "O", " ", " ", " "],
+	[" ", " ", "X", "X", "X", " ", " "]]
+    solution = c4utils.Solver().solve(c4utils.Position.from_board(board))
+    assert -1 == solution.value
+    assert 2 == solution.distance
+
+
+def test_should_solve_mid_game_win_and_analyze_columns() -> None:
+    board = [["O", " ", " ", " ", " ", " ", " "],
+	["X", " ", " ", " ", " ", " ", " "],
+	["X", " ", " ", " ", " ", " ", " "],
+	["X", " ", "O", " ", " ", " ", "X"],
+	["O", " ", "O", " ", "X", "X", "O"],
+	["X", "O", "X", "X", "O", "O", "O"]]
+    solver = c4utils.Solver()
+    solution = solver.solve(c4utils.Position.from_board(board))
+    assert 1 == solution.value
+    assert 5 == solution.move
+    assert 7 == solution.distance
+    scores = solver.analyze(c4utils.Position.from_board(board))
+    assert scores[0] is None
+    assert [5] == [col for col in range(c4gui.MAX_COLS) if scores[col] is not None and scores[col] > 0]
+    assert c4utils.shared_solver() is c4utils.shared_solver()
+    assert (3, 5) == c4utils.cpu_algorithm_perfect(board, "X")
+    assert "X" == board[3][5]
+
+
+def test_should_fall_back_to_hard_algorithm_within_time_budget() -> None:
+    board = [[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", "X", " ", " ", " "]]
+    start = time.monotonic()
+    row, col = c4utils.cpu_algorithm_perfect(board, "O", 200)
+    assert time.monotonic() - start < 0.4
+    assert "O" == board[row][col]
+
+
+def test_should_not_search_finished_game() -> None:
+    board = [[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", "O", "O", "O", " ", " "],
+	[" ", "X", "X", "X", "X", " ", " "]]
+    search = c4utils.Search(c4utils.Position.from_board(board, "O"))
+    col, score = search.best_move(4)
+    assert -1 == col
+    assert score < 0
+    assert [] == search.pv
+    try:
+        c4utils.cpu_algorithm_hard(board, "O", 4)
+        assert False
+    except ValueError:
+        pass
+
+
+def test_should_pack_transposition_entries() -> None:
+    for table, collision in ((c4utils.TranspositionTable(4), 16), (c4utils.SolverTable(17), 17)):
+        assert table.get(0) is None
+        table.put(0, 3, c4utils.Bound.UPPER, -c4utils.WIN_SCORE + 9, -1)
+        assert (3, c4utils.Bound.UPPER, -c4utils.WIN_SCORE + 9, -1) == table.get(0)
+        table.put(collision, 2, c4utils.Bound.EXACT, 5, 6)
+        assert table.get(collision) is None
+        table.put(0, 7, c4utils.Bound.LOWER, 12, 6)
+        assert (7, c4utils.Bound.LOWER, 12, 6) == table.get(0)
+
+
+def test_should_share_keys_with_mirror_image() -> None:
+    position = c4utils.Position()
+    reflected = c4utils.Position()
+    for col in [2, 3, 1, 3, 4, 2, 2]:
+        position.play(col)
+        reflected.play(c4gui.MAX_COLS - 1 - col)
+    assert position.hash == reflected.mirror_hash
+    assert position.mirror_hash == reflected.hash
+    assert c4utils.mirror(position.key()) == reflected.key()
+    assert position.canonical_key()[0] == reflected.canonical_key()[0]
+    assert position.canonical_key()[1] != reflected.canonical_key()[1]
+    while position.history:
+        position.undo()
+    assert 0 == position.mirror_hash
+
+
+def test_should_publish_search_stats_to_observer() -> None:
+    board = [[" "] * c4gui.MAX_COLS for row in range(c4gui.MAX_ROWS)]
+    stats = []
+    col = c4utils.cpu_algorithm_hard(board, "X", 5, 1000, observer=stats.append)[1]
+    assert [1, 2, 3, 4, 5] == [len(entry.iterations) for entry in stats]
+    assert [1, 2, 3, 4, 5] == [iteration.depth for iteration in stats[-1].iterations]
+    last = stats[-1]
+    assert col == last.pv[0] == last.iterations[-1].move
+    assert 5 == len(last.pv)
+    assert last.nodes == sum(iteration.nodes for iteration in last.iterations)
+    assert last.table_hits > 0 and last.table_misses > 0 and last.cutoffs >= last.first_move_cutoffs > 0
+
+    # The best root column has the exact score; the others can only be as good
+    assert set(range(c4gui.MAX_COLS)) == set(last.root_scores)
+    assert last.iterations[-1].score == last.root_scores[col] == max(last.root_scores.values())
+    assert [] == c4utils.Search(c4utils.Position()).stats().iterations
+
+
+def test_should_import_engine_without_pygame() -> None:
+    code = "import c4utils, c4batch, c4mcts, c4book, c4cache, c4parallel, c4selfplay, sys; print('pygame' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True)
+    assert "False" == result.stdout.strip(), result.stderr
+    assert c4gui.MAX_ROWS == c4utils.MAX_ROWS and c4gui.MAX_COLS == c4utils.MAX_COLS
+
 
 if __name__ == "__main__":
     test_should_return_true_if_column_is_full()
@@ -85,4 +324,22 @@ if __name__ == "__main__":
     test_should_win_for_vertical()
     test_should_win_for_diagonal()
     test_should_not_win_for_no_4_in_a_row()
+    test_should_convert_board_to_position_and_back()
+    test_should_play_and_undo_moves_on_position()
+    test_should_take_winning_move_with_hard_algorithm()
+    test_should_block_opponent_with_hard_algorithm()
+    test_should_search_within_time_budget()
+    test_should_keep_score_and_search_fewer_nodes_with_move_ordering()
+    test_should_win_at_last_placed_token()
+    test_should_drop_token_to_lowest_free_row()
+    test_should_keep_window_scores_incrementally()
+    test_should_solve_immediate_win()
+    test_should_solve_forced_loss_against_double_threat()
+    test_should_solve_mid_game_win_and_analyze_columns()
+    test_should_fall_back_to_hard_algorithm_within_time_budget()
+    test_should_not_search_finished_game()
+    test_should_pack_transposition_entries()
+    test_should_share_keys_with_mirror_image()
+    test_should_publish_search_stats_to_observer()
+    test_should_import_engine_without_pygame()
     print("PASS, 0 failures")
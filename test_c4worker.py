@@ -0,0 +1,103 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+import c4gui
+import c4utils
+import c4worker
+import os
+import pygame
+import time
+
+BOARD = [["O", " ", " ", " ", " ", " ", " "],
+	["X", " ", " ", " ", " ", " ", " "],
+	["X", " ", " ", " ", " ", " ", " "],
+	["X", " ", "O", " ", " ", " ", "X"],
+	["O", " ", "O", " ", "X", "X", "O"],
+	["X", "O", "X", "X", "O", "O", "O"]]
+
+def test_should_switch_to_solver_after_solver_discs() -> None:
+    perfect = c4utils.cpu_algorithm_perfect
+    calls = []
+    c4utils.cpu_algorithm_perfect = lambda board, letter, time_ms, cache: calls.append(time_ms) or perfect(board, letter, time_ms, cache)
+    try:
+        assert c4worker.choose_move(BOARD, "X", 10, 50, 19, "missing.bin") in range(c4gui.MAX_COLS)
+        assert [] == calls
+        assert 5 == c4worker.choose_move(BOARD, "X", 10, 1000, 18, "missing.bin")
+        assert [1000] == calls
+        assert 5 == c4worker.choose_move(BOARD, "X", 8, 1000, 18, "missing.bin")
+        assert [1000] == calls
+    finally:
+        c4utils.cpu_algorithm_perfect = perfect
+
+
+def test_should_post_move_from_worker_process() -> None:
+    worker = c4worker.Worker()
+    pygame.event.clear()
+    try:
+        worker.request(BOARD, "X", 10, 1000, 18, "missing.bin")
+        events = []
+        start = time.monotonic()
+        while not events and time.monotonic() - start < 30:
+            events = [event for event in pygame.event.get(pygame.USEREVENT) if getattr(event, "user_type", None) == "CPU_MOVE"]
+            time.sleep(0.01)
+        assert 1 == len(events)
+        assert 5 == events[0].column
+        assert events[0].error is None
+        assert not worker.busy()
+    finally:
+        worker.shutdown()
+
+
+def wait_for_move(timeout: float) -> list:
+    events = []
+    start = time.monotonic()
+    while not events and time.monotonic() - start < timeout:
+        events = [event for event in pygame.event.get(pygame.USEREVENT) if getattr(event, "user_type", None) == "CPU_MOVE"]
+        time.sleep(0.01)
+    return events
+
+
+def test_should_answer_pondered_replies_without_searching() -> None:
+    board = [[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", " ", " ", " ", " ", " "],
+	[" ", " ", "X", " ", " ", " ", " "],
+	[" ", " ", "O", "O", " ", " ", " "],
+	[" ", "X", "X", "O", "X", " ", " "]]
+    c4worker.ponder(board, "X", 5, 20, 18, "missing.bin", 1, "alphabeta", "", 0)
+    assert c4gui.MAX_COLS == len(c4worker._pondered)
+    hard = c4utils.cpu_algorithm_hard
+    c4utils.cpu_algorithm_hard = None
+    try:
+        for col in range(c4gui.MAX_COLS):
+            reply = [row[:] for row in board]
+            c4utils.drop_token(reply, col, "O")
+            assert c4worker.choose_move(reply, "X", 5, 20, 18, "missing.bin") in range(c4gui.MAX_COLS)
+    finally:
+        c4utils.cpu_algorithm_hard = hard
+    assert c4utils.Search.stop is None
+
+
+def test_should_stop_pondering_on_new_request() -> None:
+    worker = c4worker.Worker()
+    pygame.event.clear()
+    try:
+        worker.request(BOARD, "X", 8, 1000, 18, "missing.bin", ponder=True)
+        assert 1 == len(wait_for_move(30))
+        reply = [row[:] for row in BOARD]
+        c4utils.drop_token(reply, 5, "X")
+        c4utils.drop_token(reply, 1, "O")
+        start = time.monotonic()
+        worker.request(reply, "X", 8, 1000, 18, "missing.bin", ponder=True)
+        assert 1 == len(wait_for_move(30))
+        assert time.monotonic() - start < 3
+    finally:
+        worker.shutdown()
+
+
+if __name__ == "__main__":
+    test_should_switch_to_solver_after_solver_discs()
+    test_should_post_move_from_worker_process()
+    test_should_answer_pondered_replies_without_searching()
+    test_should_stop_pondering_on_new_request()
+    print("PASS, 0 failures")
@@ -80,6 +80,137 @@ def test_should_not_handle_players_move_if_column_is_full() -> None:
     assert False == connect4.player_event(game, p1turn, column)
 
 
+def test_should_load_and_scale_sprites_once_per_theme() -> None:
+    game: c4gui.Game = c4gui.game.Game(c4gui.game.GameType.DOUBLE, c4gui.styles.THEME_LIGHT, WIDTH, HEIGHT, 0)
+    game.update_board([["X" if (r + c) % 2 else "O" for c in range(c4gui.MAX_COLS)] for r in range(c4gui.MAX_ROWS)])
+    surface = pygame.Surface((WIDTH, HEIGHT))
+    load = c4gui.styles.get_color_from_tuple
+    loads = []
+    c4gui.styles.get_color_from_tuple = lambda color, sprite=False, tilted=False: loads.append(color) or load(color, sprite, tilted)
+    try:
+        game.draw_board(surface)
+        game.draw_board(surface)
+        assert 2 == len(loads)
+        sprites = dict(game.sprites)
+        assert {"board", "empty", "token", "static"} == {key[0] for key in sprites}
+
+        game.theme = c4gui.styles.THEME_DARK
+        game.draw_board(surface)
+        assert 4 == len(loads)
+        assert not any(sprite is sprites.get(key) for key, sprite in game.sprites.items())
+    finally:
+        c4gui.styles.get_color_from_tuple = load
+
+
+def test_should_redraw_only_changed_regions() -> None:
+    game: c4gui.Game = c4gui.game.Game(c4gui.game.GameType.SINGLE, c4gui.styles.THEME_LIGHT, WIDTH, HEIGHT, 0)
+    surface = pygame.Surface((WIDTH, HEIGHT))
+    assert [surface.get_rect()] == game.draw_frame(surface, True)
+    assert [] == game.draw_frame(surface, True)
+
+    # Moving the mouse only touches the old and new token spots
+    rects = game.draw_frame(surface, True, 300)
+    assert 1 == len(rects) and rects[0].width < WIDTH / 4
+    assert 2 == len(game.draw_frame(surface, True, 320))
+
+    # A move touches its cell and the turn text
+    board = game.get_boards()[-1]
+    board[5][3] = "X"
+    game.update_board(board)
+    rects = game.draw_frame(surface, False, 320)
+    assert game.get_cell_rect(5, 3) in rects
+    assert sum(rect.width * rect.height for rect in rects) < WIDTH * HEIGHT / 10
+
+    # The regions add up to the same picture as a full redraw
+    expected = pygame.Surface((WIDTH, HEIGHT))
+    game.frame_cells = None
+    game.draw_frame(expected, False, 320)
+    assert pygame.image.tostring(expected, "RGB") == pygame.image.tostring(surface, "RGB")
+
+
+def test_should_coalesce_mouse_motion_between_clicks() -> None:
+    events = [pygame.event.Event(pygame.MOUSEMOTION, pos=(10, 5), rel=(10, 5), buttons=(0, 0, 0)),
+              pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(10, 5), button=c4gui.Mouse.LEFT),
+              pygame.event.Event(pygame.MOUSEMOTION, pos=(14, 8), rel=(4, 3), buttons=(0, 0, 0)),
+              pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a),
+              pygame.event.Event(pygame.MOUSEMOTION, pos=(12, 11), rel=(-2, 3), buttons=(0, 0, 0))]
+    coalesced = c4gui.coalesce_events(events)
+    assert [pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.MOUSEMOTION] == [event.type for event in coalesced]
+    assert (12, 11) == coalesced[2].pos
+    assert (12, 11) == coalesced[2].rel
+    assert events[:2] == c4gui.coalesce_events(events[:2])
+
+
+def test_should_run_timers_and_tweens_on_frame_time() -> None:
+    scheduler = c4gui.scheduler.Scheduler()
+    fired = []
+    pause = scheduler.after(400, lambda: fired.append("pause"))
+    scheduler.after(100, lambda: fired.append("first"))
+    tween = scheduler.tween(200, 0, 100, c4gui.scheduler.ease_in, lambda: fired.append("tween"))
+    assert 100 == scheduler.until_next()
+    assert scheduler.animating()
+
+    scheduler.advance(100)
+    assert ["first"] == fired
+    assert 25 == tween.value
+    scheduler.advance(150)
+    assert 100 == tween.value and tween.done
+    assert not scheduler.animating()
+    assert 150 == scheduler.until_next()
+
+    # However many frames pass, the pause ends at the same time
+    for frame in range(14):
+        scheduler.advance(10)
+    assert not pause.done
+    scheduler.advance(10)
+    assert ["first", "tween", "pause"] == fired and pause.done
+    assert scheduler.until_next() is None
+
+    cancelled = scheduler.after(10, lambda: fired.append("cancelled"))
+    cancelled.cancel()
+    scheduler.advance(10)
+    assert 3 == len(fired)
+
+
+def test_should_drop_token_along_precomputed_path() -> None:
+    game: c4gui.Game = c4gui.game.Game(c4gui.game.GameType.DOUBLE, c4gui.styles.THEME_LIGHT, WIDTH, HEIGHT, 0)
+    surface = pygame.Surface((WIDTH, HEIGHT))
+    game.draw_frame(surface, True)
+
+    # Paths fall from the top into the cell, speeding up, and are made once per scale
+    path = game.get_drop_path(5, 3)
+    assert 0 == path[0].y and game.get_cell_rect(5, 3) == path[-1]
+    steps = [b.y - a.y for a, b in zip(path, path[1:])]
+    assert all(step >= 0 for step in steps) and steps[-1] > steps[0]
+    assert len(game.get_drop_path(0, 3)) < len(path)
+    assert path is game.get_drop_path(5, 3)
+
+    board = game.get_boards()[-1]
+    board[5][3] = "X"
+    game.update_board(board)
+    scheduler = c4gui.scheduler.Scheduler()
+    tween = game.start_drop(scheduler)
+    assert game.dropping()
+
+    # The cell stays empty while only the falling token is redrawn each frame
+    frames = 0
+    while game.dropping():
+        rects = game.draw_frame(surface, False)
+        assert " " == game.frame_cells[5][3]
+        assert sum(rect.width * rect.height for rect in rects) < WIDTH * HEIGHT / 10
+        scheduler.advance(1000 / c4gui.ANIMATION_TICKSPEED)
+        frames += 1
+    assert tween.done and len(path) - 1 == frames
+
+    # Once landed, the frame matches a full redraw of the board
+    game.draw_frame(surface, False)
+    assert "X" == game.frame_cells[5][3] and game.frame_drop is None
+    expected = pygame.Surface((WIDTH, HEIGHT))
+    game.frame_cells = None
+    game.draw_frame(expected, False)
+    assert pygame.image.tostring(expected, "RGB") == pygame.image.tostring(surface, "RGB")
+
+
 if __name__ == "__main__":
     test_should_quit_game()
     test_should_do_nothing()
@@ -88,4 +219,9 @@ if __name__ == "__main__":
     test_should_set_winner_to_tie_on_move_end_event()
     test_should_handle_players_move_if_column_is_not_full()
     test_should_not_handle_players_move_if_column_is_full()
+    test_should_load_and_scale_sprites_once_per_theme()
+    test_should_redraw_only_changed_regions()
+    test_should_coalesce_mouse_motion_between_clicks()
+    test_should_run_timers_and_tweens_on_frame_time()
+    test_should_drop_token_along_precomputed_path()
     print("PASS, 0 failures")